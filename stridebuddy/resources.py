@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
+_ASSETS_DIR = Path(__file__).resolve().parent / "assets"
 
+
+@lru_cache(maxsize=None)
 def asset_path(name: str) -> str:
     """Return absolute path to an asset within the package assets directory."""
-    return str(Path(__file__).resolve().parent / "assets" / name)
-
-
+    return str(_ASSETS_DIR / name)
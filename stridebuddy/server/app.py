@@ -1,19 +1,174 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple
 
-from flask import Flask, jsonify, request, render_template, redirect, url_for, session
-from passlib.hash import bcrypt
-from sqlalchemy import create_engine, select, text
+from argon2 import PasswordHasher, exceptions as argon2_exc
+from flask import Flask, Response, jsonify, request, render_template, redirect, url_for, session
+from flask.json.provider import DefaultJSONProvider
+import orjson
+from passlib.hash import bcrypt as legacy_bcrypt
+from sqlalchemy import bindparam, create_engine, delete, event, exists, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 from datetime import datetime, timedelta
+from collections import deque
+from contextlib import contextmanager
+import gzip
 import secrets
+import threading
 import time
 
 from .models import Base, User, Buddy
 
+# Argon2id for new hashes (RFC 9106-style parameters); costs are tunable via
+# env as hardware gets faster. Older bcrypt hashes still verify and are
+# rehashed to Argon2id on the next successful login.
+PH = PasswordHasher(
+    time_cost=int(os.getenv("SB_ARGON2_TIME_COST", "3")),
+    memory_cost=int(os.getenv("SB_ARGON2_MEMORY_KIB", str(64 * 1024))),
+    parallelism=int(os.getenv("SB_ARGON2_PARALLELISM", "4")),
+    hash_len=32,
+)
+
+
+def _is_legacy_hash(pw_hash: str) -> bool:
+    return pw_hash.startswith("$2")
+
+
+def _verify_hash(password: str, pw_hash: str) -> bool:
+    if _is_legacy_hash(pw_hash):
+        return legacy_bcrypt.verify(password, pw_hash)
+    try:
+        return PH.verify(pw_hash, password)
+    except (argon2_exc.VerificationError, argon2_exc.InvalidHashError):
+        return False
+
+
+def _needs_rehash(pw_hash: str) -> bool:
+    return _is_legacy_hash(pw_hash) or PH.check_needs_rehash(pw_hash)
+
+
+# Password hashing is CPU-bound (argon2-cffi and bcrypt release the GIL); one
+# process-wide pool capped at the core count keeps a burst of logins from
+# monopolising the request threads serving presence/poll, however many apps
+# create_app builds.
+HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="sb-hash")
+
+
+def hash_password(password: str) -> str:
+    return HASH_POOL.submit(PH.hash, password).result()
+
+
+def verify_password(password: str, pw_hash: str) -> bool:
+    return HASH_POOL.submit(_verify_hash, password, pw_hash).result()
+
+
+# Hot statements built once; call sites pass values as bind parameters
+_USER_BY_NAME = select(User).where(User.screen_name == bindparam("sn"))
+_USER_EXISTS = select(exists().where(User.screen_name == bindparam("sn")))
+_LOGIN_ROW = select(User.id, User.password_hash).where(User.screen_name == bindparam("sn"))
+_SET_PASSWORD_HASH = update(User).where(User.id == bindparam("uid")).values(password_hash=bindparam("pw_hash"))
+_BUDDY_ROWS_BY_OWNER = (
+    select(Buddy.buddy_screen_name, Buddy.group_name, Buddy.muted, Buddy.blocked, User.created_at)
+    .join(User, User.screen_name == Buddy.buddy_screen_name, isouter=True)
+    .where(Buddy.owner_screen_name == bindparam("o"))
+)
+_GROUP_EXISTS = select(1).where(Buddy.owner_screen_name == bindparam("o"), Buddy.group_name == bindparam("g")).limit(1)
+_PAIR_EXISTS = select(1).where(Buddy.owner_screen_name == bindparam("o"), Buddy.buddy_screen_name == bindparam("b")).limit(1)
+_INSERT_USER = (
+    sqlite_insert(User)
+    .values(screen_name=bindparam("sn"), password_hash=bindparam("pw_hash"))
+    .on_conflict_do_nothing(index_elements=["screen_name"])
+)
+_INSERT_BUDDY = (
+    sqlite_insert(Buddy)
+    .values(owner_screen_name=bindparam("o"), buddy_screen_name=bindparam("b"), group_name=bindparam("g"))
+    .on_conflict_do_nothing(index_elements=["owner_screen_name", "buddy_screen_name"])
+)
+_RENAME_GROUP = (
+    update(Buddy)
+    .where(Buddy.owner_screen_name == bindparam("o"), Buddy.group_name == bindparam("old"))
+    .values(group_name=bindparam("new"))
+)
+_UPDATE_PAIR = update(Buddy).where(Buddy.owner_screen_name == bindparam("o"), Buddy.buddy_screen_name == bindparam("b"))
+_DELETE_PAIR = delete(Buddy).where(Buddy.owner_screen_name == bindparam("o"), Buddy.buddy_screen_name == bindparam("b"))
+
+# Database URLs whose schema has already been created/upgraded in this process
+_MIGRATED: set[str] = set()
+# Stamped into PRAGMA user_version once the helpers below have run; bump it
+# whenever _ensure_optional_columns/_ensure_buddy_table learn a new step.
+SCHEMA_VERSION = 2
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for jsonify and request.get_json."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def _json_body() -> dict:
+    # Request JSON as a dict; anything missing or malformed reads as empty
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else {}
+
+
+def _conditional_json(payload: dict) -> Response:
+    # ETagged so pollers can revalidate with If-None-Match and get a bare 304
+    resp = jsonify(payload)
+    resp.add_etag()
+    if request.method == "POST":
+        # Werkzeug only revalidates GET/HEAD; POST queries are checked by hand
+        etag, _ = resp.get_etag()
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers={"ETag": resp.headers["ETag"]})
+        return resp
+    return resp.make_conditional(request)
+
+
+# JSON bodies below this many bytes go out as-is; gzip overhead outweighs the gain
+_GZIP_MIN_BYTES = 512
+
+
+def _gzip_json(resp: Response) -> Response:
+    # Buddy lists and presence maps repeat the same keys and status words, so
+    # they shrink several-fold. Streams (SSE) and passthrough files are left alone.
+    if (
+        resp.status_code != 200
+        or resp.mimetype != "application/json"
+        or resp.direct_passthrough
+        or resp.is_streamed
+        or "Content-Encoding" in resp.headers
+        or not request.accept_encodings["gzip"]
+    ):
+        return resp
+    body = resp.get_data()
+    if len(body) < _GZIP_MIN_BYTES:
+        return resp
+    resp.set_data(gzip.compress(body, compresslevel=5))
+    resp.headers["Content-Encoding"] = "gzip"
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+
+def _text_fields(data: dict, *names: str) -> tuple[str, ...]:
+    # Stripped string fields, "" when absent or null
+    return tuple(str(data.get(name) or "").strip() for name in names)
+
+
+def _utc_iso() -> str:
+    # Same shape as datetime.utcnow().isoformat(), built straight from the clock
+    ns = time.time_ns()
+    secs, micros = divmod(ns // 1000, 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))}.{micros:06d}"
+
 
 def get_db_url() -> str:
     data_dir = Path(os.getenv("SB_DATA_DIR", ".")).resolve()
@@ -21,42 +176,166 @@ def get_db_url() -> str:
     return f"sqlite:///{data_dir / 'stridebuddy.db'}"
 
 
+def _create_engine(db_url: str):
+    # Reuse SQLite connections across requests instead of reopening the file.
+    # Flask serves requests on multiple threads, so pooled connections must be
+    # shareable; an in-memory database needs a single shared connection.
+    # timeout makes a writer wait up to 30s for the lock instead of failing
+    # fast with "database is locked" when handlers overlap.
+    connect_args = {"check_same_thread": False, "timeout": 30}
+    if ":memory:" in db_url or db_url == "sqlite://":
+        engine = create_engine(db_url, future=True, poolclass=StaticPool, connect_args=connect_args)
+    else:
+        engine = create_engine(
+            db_url,
+            future=True,
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            connect_args=connect_args,
+        )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _record) -> None:
+        # Paid once per pooled connection: WAL lets readers run alongside a
+        # writer, and synchronous=NORMAL is safe under WAL with fewer fsyncs.
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=134217728")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+    return engine
+
+
 def create_app() -> Flask:
     app = Flask(__name__, static_folder="static", template_folder="templates")
+    app.json = OrjsonProvider(app)
     app.secret_key = os.getenv("SB_SECRET", "stridebuddy-dev-secret")
-
-    engine = create_engine(get_db_url(), future=True)
-    Base.metadata.create_all(engine)
-    _ensure_optional_columns(engine)
-    _ensure_buddy_table(engine)
+    app.after_request(_gzip_json)
+
+    db_url = get_db_url()
+    engine = _create_engine(db_url)
+    if db_url not in _MIGRATED:
+        _migrate(engine)
+        # Each in-memory engine is a brand-new database, so only file URLs stick
+        if ":memory:" not in db_url:
+            _MIGRATED.add(db_url)
     SessionLocal = sessionmaker(bind=engine, future=True)
 
+    # Verified against when a login names an unknown user, so misses pay the
+    # same hashing cost as hits and response time doesn't reveal existence.
+    # It is Argon2, so this covers Argon2 accounts only: a not-yet-upgraded
+    # legacy bcrypt account verifies at bcrypt's cost until its first login
+    # rehashes it.
+    DUMMY_HASH = hash_password(secrets.token_urlsafe(16))
+
     # In-memory presence and message queues (dev prototype)
-    ONLINE: dict[str, datetime] = {}
-    ACTIVE: dict[str, datetime] = {}
-    MESSAGE_QUEUES: dict[str, list[dict]] = {}
-    TYPING: dict[tuple[str, str], datetime] = {}  # key: (recipient, sender) -> expires
+    # Presence timestamps are time.monotonic() floats; writers and full scans
+    # hold PRESENCE_LOCK so iteration never races a heartbeat insert.
+    PRESENCE_LOCK = threading.Lock()
+    ONLINE: dict[str, float] = {}
+    ACTIVE: dict[str, float] = {}
+    ONLINE_WINDOW = 20.0
+    # Clients that heartbeat once a minute (hidden and idle) say so with
+    # "slow"; only they get the wider window, so a crashed client on the
+    # normal cadence still drops offline after ONLINE_WINDOW
+    SLOW_ONLINE_WINDOW = 90.0
+    SLOW_HEARTBEAT: set[str] = set()
+    IDLE_WINDOW = 300.0
+    MAX_PRESENCE_NAMES = 256
+    MAX_BUDDY_OPS = 64  # per /api/buddies/batch request
+    MESSAGE_QUEUES: dict[str, deque[dict]] = {}
+    MAX_QUEUED_MESSAGES = 1024  # per recipient; oldest dropped beyond this
+    # Undelivered messages for a user who stays offline are dropped this long
+    # after the newest one arrived
+    MAX_QUEUE_AGE = 3600.0
+    QUEUE_TOUCHED: dict[str, float] = {}  # recipient -> monotonic time of last enqueue
+    SSE_KEEPALIVE = 15.0
+    TYPING: dict[tuple[str, str], float] = {}  # key: (recipient, sender) -> monotonic expiry
+    WAITERS: dict[str, threading.Condition] = {}  # per-recipient wakeup for long-poll
+    LISTENERS: dict[str, int] = {}  # polls/streams waiting per recipient, mutated under its Condition
+
+    def waiter_for(name: str) -> threading.Condition:
+        # Fast path skips building a Condition (and its lock) on every call;
+        # setdefault keeps first-creation atomic so two threads never end up
+        # holding different conditions for the same recipient.
+        return WAITERS.get(name) or WAITERS.setdefault(name, threading.Condition())
+
+    @contextmanager
+    def held_waiter(name: str, listen: bool = False):
+        # Yields the recipient's registered Condition, held. The sweep only
+        # drops a Condition while holding it with no listener counted, so once
+        # it is held and still registered nobody can swap in a new one and
+        # split the queue's lock. listen counts the caller across its waits.
+        while True:
+            cond = waiter_for(name)
+            cond.acquire()
+            if WAITERS.get(name) is cond:
+                break
+            cond.release()
+        if listen:
+            LISTENERS[name] = LISTENERS.get(name, 0) + 1
+        try:
+            yield cond
+        finally:
+            if listen:
+                left = LISTENERS.pop(name, 1) - 1
+                if left:
+                    LISTENERS[name] = left
+            cond.release()
+
+    def window_of(name: str) -> float:
+        return SLOW_ONLINE_WINDOW if name in SLOW_HEARTBEAT else ONLINE_WINDOW
+
+    def status_of(name: str, now: float) -> str:
+        last = ONLINE.get(name, 0.0)
+        if last == 0.0 or (now - last) > window_of(name):
+            return "offline"
+        return "away" if (now - ACTIVE.get(name, last)) >= IDLE_WINDOW else "online"
+
+    threading.Thread(
+        target=_gc_loop,
+        args=(PRESENCE_LOCK, ONLINE, ACTIVE, SLOW_HEARTBEAT, TYPING, MESSAGE_QUEUES, QUEUE_TOUCHED, WAITERS, LISTENERS, MAX_QUEUE_AGE),
+        name="sb-presence-gc",
+        daemon=True,
+    ).start()
 
     @app.get("/")
     def root() -> Tuple[str, int] | str:
         return redirect(url_for("signup"))
 
+    # Reuse runner.svg as favicon to avoid 404 noise; read once at boot so
+    # browsers hitting it on every page don't cost a stat/open per request.
+    FAVICON_BYTES = (Path(app.static_folder) / "runner.svg").read_bytes()
+
     @app.get("/favicon.ico")
     def favicon():
-        # Reuse runner.svg as favicon to avoid 404 noise
-        return app.send_static_file("runner.svg")
+        return Response(FAVICON_BYTES, mimetype="image/svg+xml", headers={"Cache-Control": "public, max-age=86400"})
+
+    # Static pages have no per-request variables; rendered once after all
+    # routes exist (they url_for each other) and served from memory.
+    STATIC_PAGES: dict[str, str] = {}
 
     @app.get("/signup")
-    def signup() -> str:
-        return render_template("signup.html")
+    def signup() -> Response:
+        return Response(STATIC_PAGES["signup.html"], mimetype="text/html")
 
     @app.get("/forgot")
-    def forgot() -> str:
-        return render_template("forgot.html")
+    def forgot() -> Response:
+        return Response(STATIC_PAGES["forgot.html"], mimetype="text/html")
 
     @app.route("/help", methods=["GET"], strict_slashes=False)
-    def help_page() -> str:
-        return render_template("help.html")
+    def help_page() -> Response:
+        return Response(STATIC_PAGES["help.html"], mimetype="text/html")
+
+    # Cheap probe the sign-on window hits at startup to open a keep-alive
+    # connection before the first login POST
+    @app.get("/api/health")
+    def health() -> Response:
+        return Response(status=204)
 
     # --- Presence & Messaging (prototype) ---
     @app.post("/api/presence/heartbeat")
@@ -64,59 +343,71 @@ def create_app() -> Flask:
         user = session.get("user")
         if not user:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        data = request.get_json(silent=True) or {}
-        ONLINE[user] = datetime.utcnow()
-        if data.get("active"):
-            ACTIVE[user] = datetime.utcnow()
+        data = _json_body()
+        now = time.monotonic()
+        with PRESENCE_LOCK:
+            ONLINE[user] = now
+            if data.get("active"):
+                ACTIVE[user] = now
+            if data.get("slow"):
+                SLOW_HEARTBEAT.add(user)
+            else:
+                SLOW_HEARTBEAT.discard(user)
         return jsonify({"ok": True})
 
     @app.get("/api/presence/online")
     def presence_online():
         # Backward-compat simple list
-        now = datetime.utcnow()
-        online = [name for name, ts in ONLINE.items() if (now - ts) < timedelta(seconds=20)]
-        return jsonify({"ok": True, "online": online})
-
-    @app.get("/api/presence/status")
+        now = time.monotonic()
+        # Snapshot under the lock, filter outside it
+        with PRESENCE_LOCK:
+            seen = list(ONLINE.items())
+        online = [name for name, ts in seen if (now - ts) < window_of(name)]
+        return _conditional_json({"ok": True, "online": online})
+
+    @app.route("/api/presence/status", methods=["GET", "POST"])
     def presence_status():
-        names_param = (request.args.get("names") or "").strip()
-        names = [n for n in (names_param.split(",") if names_param else []) if n]
-        now = datetime.utcnow()
-        statuses = {}
-        online_window = timedelta(seconds=20)
-        idle_window = timedelta(minutes=5)
-        for name in names:
-            last = ONLINE.get(name)
-            if not last or (now - last) > online_window:
-                statuses[name] = "offline"
-                continue
-            last_active = ACTIVE.get(name, last)
-            if (now - last_active) >= idle_window:
-                statuses[name] = "away"
-            else:
-                statuses[name] = "online"
-        return jsonify({"ok": True, "statuses": statuses})
+        # POST takes {"names": [...]} so long buddy lists don't ride in the URL
+        if request.method == "POST":
+            raw = _json_body().get("names")
+            raw = [n for n in raw if isinstance(n, str)] if isinstance(raw, list) else []
+        else:
+            names_param = (request.args.get("names") or "").strip()
+            raw = names_param.split(",") if names_param else []
+        if len(raw) > MAX_PRESENCE_NAMES:
+            return jsonify({"ok": False, "error": f"at most {MAX_PRESENCE_NAMES} names"}), 400
+        # Dedupe (buddies may repeat across groups) and drop impossible names
+        names = list(dict.fromkeys(n for n in raw if 2 <= len(n) <= 32))
+        if not ONLINE:
+            return _conditional_json({"ok": True, "statuses": {n: "offline" for n in names}})
+        now = time.monotonic()
+        statuses = {name: status_of(name, now) for name in names}
+        return _conditional_json({"ok": True, "statuses": statuses})
 
     @app.post("/api/messages/send")
     def send_message():
         user = session.get("user")
         if not user:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        data = request.get_json(silent=True) or {}
         sender = user
-        to = (data.get("to") or "").strip()
-        content = (data.get("content") or "").strip()
-        content_html = (data.get("content_html") or "").strip()
+        to, content, content_html = _text_fields(_json_body(), "to", "content", "content_html")
         if not to or not content:
             return jsonify({"ok": False, "error": "to and content required"}), 400
+        # Unknown names would otherwise each leave a queue nobody can drain
+        with SessionLocal() as db:
+            if not db.scalar(_USER_EXISTS, {"sn": to}):
+                return jsonify({"ok": False, "error": "user not found"}), 404
         msg = {
             "from": sender,
             "to": to,
             "content": content,
             "content_html": content_html,
-            "ts": datetime.utcnow().isoformat(),
+            "ts": _utc_iso(),
         }
-        MESSAGE_QUEUES.setdefault(to, []).append(msg)
+        with held_waiter(to) as cond:
+            MESSAGE_QUEUES.setdefault(to, deque(maxlen=MAX_QUEUED_MESSAGES)).append(msg)
+            QUEUE_TOUCHED[to] = time.monotonic()
+            cond.notify_all()
         return jsonify({"ok": True})
 
     @app.get("/api/messages/poll")
@@ -125,27 +416,69 @@ def create_app() -> Flask:
         if not screen_name:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
         timeout = int(request.args.get("timeout", "15"))
-        deadline = time.time() + min(timeout, 30)
-        while time.time() < deadline:
-            queue = MESSAGE_QUEUES.get(screen_name, [])
+        # Wait on the recipient's condition; send_message notifies on enqueue.
+        # The queue is checked and drained under the lock so no wakeup is lost.
+        with held_waiter(screen_name, listen=True) as cond:
+            cond.wait_for(lambda: MESSAGE_QUEUES.get(screen_name), timeout=max(0, min(timeout, 30)))
+            queue = MESSAGE_QUEUES.get(screen_name)
+            out = list(queue) if queue else []
             if queue:
-                out = queue.copy()
-                MESSAGE_QUEUES[screen_name] = []
-                return jsonify({"ok": True, "messages": out})
-            time.sleep(0.4)
-        return jsonify({"ok": True, "messages": []})
+                queue.clear()
+        return jsonify({"ok": True, "messages": out})
+
+    @app.get("/api/messages/stream")
+    def stream_messages():
+        # Server-Sent Events: one long-lived response per client instead of a
+        # poll per delivery. Frames are drained with the same condition poll
+        # uses; a comment line every SSE_KEEPALIVE seconds keeps proxies open.
+        screen_name = session.get("user")
+        if not screen_name:
+            return jsonify({"ok": False, "error": "unauthorized"}), 401
+
+        def stream():
+            # Tell EventSource-style clients how soon to reconnect after a drop
+            yield "retry: 3000\n\n"
+            while True:
+                # Re-taken each round: between rounds the sweep may retire an
+                # idle recipient's Condition and the next round gets the new one
+                with held_waiter(screen_name, listen=True) as cond:
+                    cond.wait_for(lambda: MESSAGE_QUEUES.get(screen_name), timeout=SSE_KEEPALIVE)
+                    queue = MESSAGE_QUEUES.get(screen_name)
+                    out = list(queue) if queue else []
+                    if queue:
+                        queue.clear()
+                if not out:
+                    yield ": keepalive\n\n"
+                    continue
+                for i, msg in enumerate(out):
+                    try:
+                        yield f"data: {app.json.dumps(msg)}\n\n"
+                    except GeneratorExit:
+                        # Client went away mid-batch: the frame being written
+                        # and everything after it go back to the queue front
+                        # so the next stream/poll delivers them.
+                        with held_waiter(screen_name) as cond:
+                            queue = MESSAGE_QUEUES.setdefault(screen_name, deque(maxlen=MAX_QUEUED_MESSAGES))
+                            queue.extendleft(reversed(out[i:]))
+                            cond.notify_all()
+                        raise
+
+        return Response(
+            stream(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     @app.post("/api/messages/typing")
     def typing_ping():
         user = session.get("user")
         if not user:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        data = request.get_json(silent=True) or {}
-        to = (data.get("to") or "").strip()
+        (to,) = _text_fields(_json_body(), "to")
         if not to:
             return jsonify({"ok": False, "error": "to required"}), 400
         # Keep indicator alive a bit longer than the client poll
-        TYPING[(to, user)] = datetime.utcnow() + timedelta(seconds=6)
+        TYPING[(to, user)] = time.monotonic() + 6.0
         return jsonify({"ok": True})
 
     @app.get("/api/messages/typing")
@@ -153,12 +486,12 @@ def create_app() -> Flask:
         user = session.get("user")
         if not user:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        now = datetime.utcnow()
+        now = time.monotonic()
         active = []
         # collect senders typing to 'user'
         for (recipient, sender), expires in list(TYPING.items()):
             if expires <= now:
-                del TYPING[(recipient, sender)]
+                TYPING.pop((recipient, sender), None)
                 continue
             if recipient == user:
                 active.append(sender)
@@ -169,31 +502,40 @@ def create_app() -> Flask:
         owner = session.get("user")
         if not owner:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
+        # One joined, column-only SELECT plus in-memory presence, so clients can
+        # render statuses without a follow-up request per buddy.
         with SessionLocal() as db:
-            rows = db.query(Buddy).filter(Buddy.owner_screen_name == owner).all()
-            data = [{"buddy": b.buddy_screen_name, "group": b.group_name or "", "muted": int(b.muted or 0), "blocked": int(b.blocked or 0)} for b in rows]
-        return jsonify({"ok": True, "buddies": data})
+            rows = db.execute(_BUDDY_ROWS_BY_OWNER, {"o": owner}).all()
+        now = time.monotonic()
+        data = [
+            {
+                "buddy": name,
+                "group": group or "",
+                "muted": int(muted or 0),
+                "blocked": int(blocked or 0),
+                "status": status_of(name, now),
+                "joined": joined.isoformat() if joined else "",
+            }
+            for name, group, muted, blocked, joined in rows
+        ]
+        return _conditional_json({"ok": True, "buddies": data})
 
     @app.post("/api/buddies")
     def add_buddy():
         owner = session.get("user")
         if not owner:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        data = request.get_json(silent=True) or {}
-        buddy = (data.get("buddy") or "").strip()
-        group = (data.get("group") or "").strip() or None
+        buddy, group = _text_fields(_json_body(), "buddy", "group")
+        group = group or None
         if not buddy:
             return jsonify({"ok": False, "error": "buddy required"}), 400
         if buddy == owner:
             return jsonify({"ok": False, "error": "cannot add yourself"}), 400
         with SessionLocal() as db:
-            target = db.scalar(select(User).where(User.screen_name == buddy))
-            if not target:
+            if not db.scalar(_USER_EXISTS, {"sn": buddy}):
                 return jsonify({"ok": False, "error": "user not found"}), 404
-            exists = db.scalar(select(Buddy).where(Buddy.owner_screen_name == owner, Buddy.buddy_screen_name == buddy))
-            if exists:
-                return jsonify({"ok": True})
-            db.add(Buddy(owner_screen_name=owner, buddy_screen_name=buddy, group_name=group))
+            # Already-added buddies are a no-op via the (owner, buddy) unique index
+            db.execute(_INSERT_BUDDY, {"o": owner, "b": buddy, "g": group})
             db.commit()
         return jsonify({"ok": True})
 
@@ -202,13 +544,16 @@ def create_app() -> Flask:
         owner = session.get("user")
         if not owner:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        data = request.get_json(silent=True) or {}
-        old = (data.get("old_group") or "").strip() or None
-        new = (data.get("new_group") or "").strip() or None
+        old, new = _text_fields(_json_body(), "old_group", "new_group")
+        old = old or None
+        new = new or None
         if old is None or new is None:
             return jsonify({"ok": False, "error": "old_group and new_group required"}), 400
         with SessionLocal() as db:
-            db.query(Buddy).filter(Buddy.owner_screen_name == owner, Buddy.group_name == old).update({Buddy.group_name: new})
+            # Skip the write transaction when nothing would change
+            if not db.scalar(_GROUP_EXISTS, {"o": owner, "g": old}):
+                return jsonify({"ok": True})
+            db.execute(_RENAME_GROUP, {"o": owner, "old": old, "new": new})
             db.commit()
         return jsonify({"ok": True})
 
@@ -217,19 +562,21 @@ def create_app() -> Flask:
         owner = session.get("user")
         if not owner:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        data = request.get_json(silent=True) or {}
-        buddy = (data.get("buddy") or "").strip()
+        data = _json_body()
+        (buddy,) = _text_fields(data, "buddy")
         if not buddy:
             return jsonify({"ok": False, "error": "buddy required"}), 400
         fields = {}
         if "muted" in data:
-            fields[Buddy.muted] = 1 if data.get("muted") else 0
+            fields["muted"] = 1 if data.get("muted") else 0
         if "blocked" in data:
-            fields[Buddy.blocked] = 1 if data.get("blocked") else 0
+            fields["blocked"] = 1 if data.get("blocked") else 0
         if not fields:
             return jsonify({"ok": False, "error": "no flags to update"}), 400
         with SessionLocal() as db:
-            db.query(Buddy).filter(Buddy.owner_screen_name == owner, Buddy.buddy_screen_name == buddy).update(fields)
+            if not db.scalar(_PAIR_EXISTS, {"o": owner, "b": buddy}):
+                return jsonify({"ok": True})
+            db.execute(_UPDATE_PAIR.values(fields), {"o": owner, "b": buddy})
             db.commit()
         return jsonify({"ok": True})
 
@@ -238,60 +585,98 @@ def create_app() -> Flask:
         owner = session.get("user")
         if not owner:
             return jsonify({"ok": False, "error": "unauthorized"}), 401
-        data = request.get_json(silent=True) or {}
-        buddy = (data.get("buddy") or "").strip()
+        (buddy,) = _text_fields(_json_body(), "buddy")
         if not buddy:
             return jsonify({"ok": False, "error": "buddy required"}), 400
         with SessionLocal() as db:
-            db.query(Buddy).filter(Buddy.owner_screen_name == owner, Buddy.buddy_screen_name == buddy).delete()
+            db.execute(_DELETE_PAIR, {"o": owner, "b": buddy})
             db.commit()
         return jsonify({"ok": True})
 
+    @app.post("/api/buddies/batch")
+    def batch_buddies():
+        # Several adds/removes in one round trip (and one transaction); each
+        # op gets its own result, mirroring the single-op endpoints
+        owner = session.get("user")
+        if not owner:
+            return jsonify({"ok": False, "error": "unauthorized"}), 401
+        ops = _json_body().get("ops")
+        if not isinstance(ops, list) or not ops:
+            return jsonify({"ok": False, "error": "ops required"}), 400
+        if len(ops) > MAX_BUDDY_OPS:
+            return jsonify({"ok": False, "error": f"at most {MAX_BUDDY_OPS} ops"}), 400
+        results = []
+        with SessionLocal() as db:
+            for op in ops:
+                if not isinstance(op, dict):
+                    results.append({"ok": False, "error": "invalid op"})
+                    continue
+                kind, buddy, group = _text_fields(op, "op", "buddy", "group")
+                if not buddy:
+                    results.append({"ok": False, "error": "buddy required"})
+                elif kind == "add":
+                    if buddy == owner:
+                        results.append({"ok": False, "error": "cannot add yourself"})
+                    elif not db.scalar(_USER_EXISTS, {"sn": buddy}):
+                        results.append({"ok": False, "error": "user not found"})
+                    else:
+                        db.execute(_INSERT_BUDDY, {"o": owner, "b": buddy, "g": group or None})
+                        results.append({"ok": True})
+                elif kind == "remove":
+                    db.execute(_DELETE_PAIR, {"o": owner, "b": buddy})
+                    results.append({"ok": True})
+                else:
+                    results.append({"ok": False, "error": "unknown op"})
+            db.commit()
+        return jsonify({"ok": True, "results": results})
+
     @app.post("/api/auth/signup")
     def api_signup():
-        data = request.get_json(silent=True) or {}
-        screen_name = (data.get("screen_name") or "").strip()
-        password = (data.get("password") or "").strip()
+        screen_name, password = _text_fields(_json_body(), "screen_name", "password")
         if not screen_name or not password:
             return jsonify({"ok": False, "error": "screen_name and password required"}), 400
         if len(screen_name) < 2 or len(screen_name) > 32:
             return jsonify({"ok": False, "error": "screen_name must be 2-32 chars"}), 400
-        pw_hash = bcrypt.hash(password)
+        pw_hash = hash_password(password)
         with SessionLocal() as db:
-            exists = db.scalar(select(User).where(User.screen_name == screen_name))
-            if exists:
+            result = db.execute(_INSERT_USER, {"sn": screen_name, "pw_hash": pw_hash})
+            if result.rowcount == 0:
                 return jsonify({"ok": False, "error": "screen_name already taken"}), 409
-            user = User(screen_name=screen_name, password_hash=pw_hash)
-            db.add(user)
             db.commit()
         return jsonify({"ok": True})
 
     @app.post("/api/auth/login")
     def api_login():
-        data = request.get_json(silent=True) or {}
-        screen_name = (data.get("screen_name") or "").strip()
-        password = (data.get("password") or "").strip()
+        screen_name, password = _text_fields(_json_body(), "screen_name", "password")
         if not screen_name or not password:
             return jsonify({"ok": False, "error": "screen_name and password required"}), 400
         with SessionLocal() as db:
-            user = db.scalar(select(User).where(User.screen_name == screen_name))
-            if not user or not bcrypt.verify(password, user.password_hash):
+            # Only the id and hash are needed, so skip hydrating a User
+            row = db.execute(_LOGIN_ROW, {"sn": screen_name}).first()
+            # Always run exactly one verify, so unknown names and wrong
+            # passwords cost the same hash work
+            ok = verify_password(password, row.password_hash if row is not None else DUMMY_HASH)
+            if row is None or not ok:
                 return jsonify({"ok": False, "error": "invalid credentials"}), 401
+            # Transparently upgrade bcrypt or older-cost Argon2 hashes
+            if _needs_rehash(row.password_hash):
+                db.execute(_SET_PASSWORD_HASH, {"uid": row.id, "pw_hash": hash_password(password)})
+                db.commit()
         # Set session cookie
         session["user"] = screen_name
         return jsonify({"ok": True})
 
     @app.post("/api/auth/request_reset")
     def api_request_reset():
-        data = request.get_json(silent=True) or {}
-        screen_name = (data.get("screen_name") or "").strip()
+        (screen_name,) = _text_fields(_json_body(), "screen_name")
         if not screen_name:
             return jsonify({"ok": False, "error": "screen_name required"}), 400
         with SessionLocal() as db:
-            user = db.scalar(select(User).where(User.screen_name == screen_name))
+            user = db.scalar(_USER_BY_NAME, {"sn": screen_name})
             if not user:
                 return jsonify({"ok": True})  # don't reveal existence
-            code = f"{secrets.randbelow(1000000):06d}"
+            # One 64-bit read; modulo bias over 2**64 is negligible for 6 digits
+            code = f"{int.from_bytes(secrets.token_bytes(8), 'big') % 1_000_000:06d}"
             user.reset_code = code
             user.reset_expires_at = datetime.utcnow() + timedelta(minutes=15)
             db.commit()
@@ -300,24 +685,25 @@ def create_app() -> Flask:
 
     @app.post("/api/auth/reset")
     def api_reset():
-        data = request.get_json(silent=True) or {}
-        screen_name = (data.get("screen_name") or "").strip()
-        code = (data.get("code") or "").strip()
-        new_password = (data.get("new_password") or "").strip()
+        screen_name, code, new_password = _text_fields(_json_body(), "screen_name", "code", "new_password")
         if not all([screen_name, code, new_password]):
             return jsonify({"ok": False, "error": "screen_name, code, new_password required"}), 400
         with SessionLocal() as db:
-            user = db.scalar(select(User).where(User.screen_name == screen_name))
+            user = db.scalar(_USER_BY_NAME, {"sn": screen_name})
             if not user or not user.reset_code or user.reset_code != code:
                 return jsonify({"ok": False, "error": "invalid code"}), 400
             if user.reset_expires_at and user.reset_expires_at < datetime.utcnow():
                 return jsonify({"ok": False, "error": "code expired"}), 400
-            user.password_hash = bcrypt.hash(new_password)
+            user.password_hash = hash_password(new_password)
             user.reset_code = None
             user.reset_expires_at = None
             db.commit()
         return jsonify({"ok": True})
 
+    with app.test_request_context("/"):
+        for page in ("signup.html", "forgot.html", "help.html"):
+            STATIC_PAGES[page] = render_template(page)
+
     return app
 
 
@@ -330,6 +716,17 @@ def main() -> None:
 if __name__ == "__main__":
     main()
 
+def _migrate(engine) -> None:
+    # A database already stamped with the current version needs no schema scans
+    with engine.connect() as conn:
+        if conn.execute(text("PRAGMA user_version")).scalar() == SCHEMA_VERSION:
+            return
+    Base.metadata.create_all(engine)
+    _ensure_optional_columns(engine)
+    _ensure_buddy_table(engine)
+    with engine.begin() as conn:
+        conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+
 def _ensure_optional_columns(engine) -> None:
     # Tiny migration helper: add reset columns if they don't exist.
     with engine.begin() as conn:
@@ -338,6 +735,7 @@ def _ensure_optional_columns(engine) -> None:
             conn.execute(text("ALTER TABLE users ADD COLUMN reset_code VARCHAR(32)"))
         if "reset_expires_at" not in cols:
             conn.execute(text("ALTER TABLE users ADD COLUMN reset_expires_at DATETIME"))
+        conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_screen_name ON users (screen_name)"))
 
 def _ensure_buddy_table(engine) -> None:
     with engine.begin() as conn:
@@ -360,5 +758,59 @@ def _ensure_buddy_table(engine) -> None:
                 conn.execute(text("ALTER TABLE buddies ADD COLUMN muted INTEGER DEFAULT 0"))
             if "blocked" not in cols:
                 conn.execute(text("ALTER TABLE buddies ADD COLUMN blocked INTEGER DEFAULT 0"))
-
-
+        # Upgrade older databases: collapse duplicate pairs left by the old
+        # check-then-insert path so the unique index UPSERTs rely on can exist
+        if "uq_buddies_owner_buddy" not in _index_names(conn, "buddies"):
+            conn.execute(text("""
+                DELETE FROM buddies WHERE id NOT IN (
+                    SELECT MIN(id) FROM buddies GROUP BY owner_screen_name, buddy_screen_name
+                )
+            """))
+            conn.execute(text("DROP INDEX IF EXISTS ix_buddies_owner_buddy"))
+            conn.execute(text("CREATE UNIQUE INDEX uq_buddies_owner_buddy ON buddies (owner_screen_name, buddy_screen_name)"))
+        # Redundant with the composite index's leading column
+        conn.execute(text("DROP INDEX IF EXISTS ix_buddies_owner_screen_name"))
+
+def _index_names(conn, table: str) -> set[str]:
+    return {row[1] for row in conn.execute(text(f"PRAGMA index_list({table})")).fetchall()}
+
+
+def _gc_loop(lock, online, active, slow, typing, queues, touched, waiters, listeners, queue_max_age: float,
+             interval: float = 30.0, max_age: float = 120.0) -> None:
+    # Sweep users who stopped heartbeating so presence scans stay proportional
+    # to who's actually around, and drop drained or long-undelivered queues
+    # for departed users.
+    # max_age only needs to exceed the widest (slow-heartbeat) online window: past it a user reads as
+    # offline whether or not their entry is still here.
+    while True:
+        time.sleep(interval)
+        now = time.monotonic()
+        cutoff = now - max_age
+        with lock:
+            for name, ts in list(online.items()):
+                if ts < cutoff:
+                    online.pop(name, None)
+                    active.pop(name, None)
+                    slow.discard(name)
+        for key, expires in list(typing.items()):
+            if expires <= now:
+                typing.pop(key, None)
+        # Queues are only ever created under their recipient's Condition, so
+        # walking the Conditions covers every queue. One is retired only while
+        # held, with its user swept offline, nobody waiting on it and its
+        # queue drained or untouched for queue_max_age; held_waiter re-checks registration after acquiring,
+        # so no sender or listener can keep using a retired one.
+        for name in list(waiters.keys()):
+            if name in online:
+                continue
+            cond = waiters.get(name)
+            if cond is None:
+                continue
+            with cond:
+                if listeners.get(name):
+                    continue
+                if queues.get(name) and now - touched.get(name, now) < queue_max_age:
+                    continue
+                queues.pop(name, None)
+                touched.pop(name, None)
+                waiters.pop(name, None)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import String, DateTime, func
+from sqlalchemy import String, DateTime, Index, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from typing import Optional
 
@@ -24,9 +24,11 @@ class User(Base):
 
 class Buddy(Base):
     __tablename__ = "buddies"
+    __table_args__ = (Index("uq_buddies_owner_buddy", "owner_screen_name", "buddy_screen_name", unique=True),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    owner_screen_name: Mapped[str] = mapped_column(String(32), index=True)
+    # Lookups by owner use the leading column of uq_buddies_owner_buddy
+    owner_screen_name: Mapped[str] = mapped_column(String(32))
     buddy_screen_name: Mapped[str] = mapped_column(String(32), index=True)
     group_name: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     muted: Mapped[int] = mapped_column(default=0)
@@ -3,12 +3,40 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 import keyring
 
 APP_NAME = "StrideBuddy"
 
+# Single source of truth for setting defaults; read-only so no caller can
+# mutate it through a returned dict (lists are copied by _copy_settings).
+_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "last_screen_name": "",
+    "save_password": False,
+    "auto_login": False,
+    "server_url": "http://127.0.0.1:5000",
+    "notifications_sounds": True,
+    "notifications_toasts": True,
+    "chat_default_bold": False,
+    "chat_default_italic": False,
+    "chat_allow_links": True,
+    "chat_emoji_replace": True,
+    "chat_transcripts_enabled": False,
+    "appearance_theme": "Light",
+    "appearance_compact": False,
+    "appearance_timestamp_format": "12h",
+    "appearance_font_size": 9,
+    "privacy_buddies_only": False,
+    "privacy_warn_confirm": True,
+    "saved_accounts": [],
+})
+
+# Last parsed settings, keyed by the file's (mtime_ns, size) so repeat loads
+# skip the read + JSON parse until something rewrites the file.
+_cache: tuple[tuple[int, int], Dict[str, Any]] | None = None
+
 
 def get_app_dir() -> Path:
     # Prefer roaming app data on Windows
@@ -25,79 +53,42 @@ def settings_path() -> Path:
     return get_app_dir() / "settings.json"
 
 
+def _copy_settings(data: Mapping[str, Any]) -> Dict[str, Any]:
+    # Callers mutate what they get back; never hand out the cached dict itself
+    out = dict(data)
+    out["saved_accounts"] = list(data.get("saved_accounts") or [])
+    return out
+
+
 def load_settings() -> Dict[str, Any]:
+    global _cache
     p = settings_path()
-    if not p.exists():
-        return {
-            "last_screen_name": "",
-            "save_password": False,
-            "auto_login": False,
-            "server_url": "http://127.0.0.1:5000",
-            "notifications_sounds": True,
-            "notifications_toasts": True,
-            "chat_default_bold": False,
-            "chat_default_italic": False,
-            "chat_allow_links": True,
-            "chat_emoji_replace": True,
-            "chat_transcripts_enabled": False,
-            "appearance_theme": "Light",
-            "appearance_compact": False,
-            "appearance_timestamp_format": "12h",
-            "appearance_font_size": 9,
-            "privacy_buddies_only": False,
-            "privacy_warn_confirm": True,
-            "saved_accounts": [],
-        }
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        # ensure defaults
-        data.setdefault("last_screen_name", "")
-        data.setdefault("save_password", False)
-        data.setdefault("auto_login", False)
-        data.setdefault("server_url", "http://127.0.0.1:5000")
-        data.setdefault("notifications_sounds", True)
-        data.setdefault("notifications_toasts", True)
-        data.setdefault("chat_default_bold", False)
-        data.setdefault("chat_default_italic", False)
-        data.setdefault("chat_allow_links", True)
-        data.setdefault("chat_emoji_replace", True)
-        data.setdefault("chat_transcripts_enabled", False)
-        data.setdefault("appearance_theme", "Light")
-        data.setdefault("appearance_compact", False)
-        data.setdefault("appearance_timestamp_format", "12h")
-        data.setdefault("appearance_font_size", 9)
-        data.setdefault("privacy_buddies_only", False)
-        data.setdefault("privacy_warn_confirm", True)
-        data.setdefault("saved_accounts", [])
-        return data
+        stat = p.stat()
+    except OSError:
+        return _copy_settings(_DEFAULTS)
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _cache is not None and _cache[0] == key:
+        return _copy_settings(_cache[1])
+    try:
+        data = {**_DEFAULTS, **json.loads(p.read_text(encoding="utf-8"))}
     except Exception:
-        return {
-            "last_screen_name": "",
-            "save_password": False,
-            "auto_login": False,
-            "server_url": "http://127.0.0.1:5000",
-            "notifications_sounds": True,
-            "notifications_toasts": True,
-            "chat_default_bold": False,
-            "chat_default_italic": False,
-            "chat_allow_links": True,
-            "chat_emoji_replace": True,
-            "chat_transcripts_enabled": False,
-            "appearance_theme": "Light",
-            "appearance_compact": False,
-            "appearance_timestamp_format": "12h",
-            "appearance_font_size": 9,
-            "privacy_buddies_only": False,
-            "privacy_warn_confirm": True,
-            "saved_accounts": [],
-        }
+        return _copy_settings(_DEFAULTS)
+    _cache = (key, _copy_settings(data))
+    return _copy_settings(data)
 
 
 def save_settings(data: Dict[str, Any]) -> None:
+    global _cache
     p = settings_path()
     tmp = p.with_suffix(".tmp")
     tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
     tmp.replace(p)
+    # Seed the cache with what load_settings would now return, no re-read needed
+    _cache = None
+    if isinstance(data, dict):
+        stat = p.stat()
+        _cache = ((stat.st_mtime_ns, stat.st_size), _copy_settings({**_DEFAULTS, **data}))
 
 
 def get_saved_password(screen_name: str) -> str | None:
@@ -111,10 +102,10 @@ def set_saved_password(screen_name: str, password: str) -> None:
         keyring.set_password(APP_NAME, screen_name, password)
         # Track saved accounts for convenience
         st = load_settings()
-        accs = set(st.get("saved_accounts", []))
-        accs.add(screen_name)
-        st["saved_accounts"] = sorted(accs)
-        save_settings(st)
+        accs = st.setdefault("saved_accounts", [])
+        if screen_name not in accs:
+            st["saved_accounts"] = sorted({*accs, screen_name})
+            save_settings(st)
 
 
 def delete_saved_password(screen_name: str) -> None:
@@ -143,8 +134,9 @@ def clear_all_saved_passwords() -> None:
         except Exception:
             pass
     st = load_settings()
-    st["saved_accounts"] = []
-    save_settings(st)
+    if st.get("saved_accounts"):
+        st["saved_accounts"] = []
+        save_settings(st)
 
 
 def open_settings_folder() -> None:
@@ -4,49 +4,42 @@ from PySide6.QtGui import QPalette, QColor, QFont
 from PySide6.QtWidgets import QApplication
 
 
-def apply_stridebuddy_style(app: QApplication, settings: dict | None = None) -> None:
-    """Apply palette, spacing, and fonts based on settings."""
-    settings = settings or {}
+_WHITE = QColor("#ffffff")
+_TEXT = QColor("#000000")
+_DISABLED_TEXT = QColor("#808080")
+_MID_SHADOW = QColor("#c8c8c8")
+_ACCENT = QColor("#1e73be")
+# theme -> (window background, alternate base)
+_THEME_COLORS = {
+    "retro": (QColor("#f3f0e6"), QColor("#f8f4ec")),  # warm beige
+    "light": (QColor("#f1f1f1"), QColor("#f8f8f8")),
+}
 
-    # Font
-    base_font = QFont("Tahoma", 9 if not settings.get("appearance_font_size") else int(settings["appearance_font_size"]))
-    app.setFont(base_font)
+# (theme, font_size, compact) -> (stylesheet, palette)
+_STYLE_CACHE: dict[tuple, tuple[str, QPalette]] = {}
 
-    # Theme
-    theme = (settings.get("appearance_theme") or "Light").lower()
-    palette = QPalette()
-    white = QColor("#ffffff")
-    text_color = QColor("#000000")
-    disabled_text = QColor("#808080")
-    mid_shadow = QColor("#c8c8c8")
-    if theme == "retro":
-        window_bg = QColor("#f3f0e6")  # warm beige
-        alt_base = QColor("#f8f4ec")
-        accent = QColor("#1e73be")
-    else:
-        window_bg = QColor("#f1f1f1")
-        alt_base = QColor("#f8f8f8")
-        accent = QColor("#1e73be")
 
+def _build_palette(theme: str) -> QPalette:
+    window_bg, alt_base = _THEME_COLORS.get(theme, _THEME_COLORS["light"])
+    palette = QPalette()
     palette.setColor(QPalette.Window, window_bg)
-    palette.setColor(QPalette.Base, white)
+    palette.setColor(QPalette.Base, _WHITE)
     palette.setColor(QPalette.AlternateBase, alt_base)
-    palette.setColor(QPalette.Text, text_color)
-    palette.setColor(QPalette.ButtonText, text_color)
-    palette.setColor(QPalette.Disabled, QPalette.Text, disabled_text)
-    palette.setColor(QPalette.Disabled, QPalette.ButtonText, disabled_text)
-    palette.setColor(QPalette.Button, white)
-    palette.setColor(QPalette.Mid, mid_shadow)
-    palette.setColor(QPalette.Highlight, accent)
-    palette.setColor(QPalette.HighlightedText, white)
-    app.setPalette(palette)
+    palette.setColor(QPalette.Text, _TEXT)
+    palette.setColor(QPalette.ButtonText, _TEXT)
+    palette.setColor(QPalette.Disabled, QPalette.Text, _DISABLED_TEXT)
+    palette.setColor(QPalette.Disabled, QPalette.ButtonText, _DISABLED_TEXT)
+    palette.setColor(QPalette.Button, _WHITE)
+    palette.setColor(QPalette.Mid, _MID_SHADOW)
+    palette.setColor(QPalette.Highlight, _ACCENT)
+    palette.setColor(QPalette.HighlightedText, _WHITE)
+    return palette
 
-    # Compact spacing
-    compact = bool(settings.get("appearance_compact", False))
+
+def _build_stylesheet(compact: bool) -> str:
     pad_ctrl = "2px 4px" if compact else "4px 6px"
     pad_btn = "3px 8px" if compact else "4px 10px"
-    app.setStyleSheet(
-        f"""
+    return f"""
         QWidget {{
             letter-spacing: 0px;
         }}
@@ -69,6 +62,28 @@ def apply_stridebuddy_style(app: QApplication, settings: dict | None = None) ->
             color: #000000;
         }}
         """
-    )
 
 
+def apply_stridebuddy_style(app: QApplication, settings: dict | None = None) -> None:
+    """Apply palette, spacing, and fonts based on settings."""
+    settings = settings or {}
+
+    font_size = 9 if not settings.get("appearance_font_size") else int(settings["appearance_font_size"])
+    theme = (settings.get("appearance_theme") or "Light").lower()
+    compact = bool(settings.get("appearance_compact", False))
+    key = (theme, font_size, compact)
+
+    # setStyleSheet/setPalette re-polish every widget; skip when nothing changed
+    installed = f"{theme}|{font_size}|{int(compact)}"
+    if app.property("sb_style_key") == installed:
+        return
+
+    cached = _STYLE_CACHE.get(key)
+    if cached is None:
+        cached = _STYLE_CACHE[key] = (_build_stylesheet(compact), _build_palette(theme))
+    stylesheet, palette = cached
+
+    app.setFont(QFont("Tahoma", font_size))
+    app.setPalette(palette)
+    app.setStyleSheet(stylesheet)
+    app.setProperty("sb_style_key", installed)
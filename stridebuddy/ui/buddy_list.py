@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QThread
+from PySide6.QtCore import Qt, QEvent, QPoint, QTimer, Signal, Slot, QObject, QRunnable, QThreadPool, QUrl, QUrlQuery
 from PySide6.QtGui import QIcon
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkCookie, QNetworkReply, QNetworkRequest
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -16,6 +17,7 @@ from PySide6.QtWidgets import (
     QTreeWidgetItem,
     QPushButton,
     QFrame,
+    QStyledItemDelegate,
 )
 
 from .. import __app_name__
@@ -23,20 +25,48 @@ from ..resources import asset_path
 from .message_window import MessageWindow
 from ..storage import load_settings
 import requests
+from urllib3.util.retry import Retry
 from PySide6.QtWidgets import QApplication
+import orjson
 import time
 
 
+# Presence states shown as-is; anything else the server reports reads as offline
+_LIVE_STATUSES = frozenset(("online", "away"))
+# Seconds a fetched buddy list is served without revalidating
+_BUDDIES_TTL = 30.0
+# Worker connection state -> (footer label text, label stylesheet)
+_STATE_LABELS = {
+    "connected": ("Connected", "QLabel { color: #16a34a; }"),
+    "reconnecting": ("Reconnecting…", "QLabel { color: #ca8a04; }"),
+    "unauthorized": ("Unauthorized", "QLabel { color: #dc2626; }"),
+}
+
+
 class BuddyListWindow(QMainWindow):
     """A minimal nostalgic buddy list window with grouped buddies."""
 
+    _hidden_changed = Signal(bool)  # -> _NetWorker.set_hidden
+
     def __init__(self, local_screen_name: str, on_signoff=None) -> None:
         super().__init__()
         self.local_screen_name = local_screen_name
         self._on_signoff = on_signoff
         self.setWindowTitle(f"{__app_name__} - Buddy List")
-        self.setWindowIcon(QIcon(asset_path("sb_runner.svg")))
+        # Parsed once; reused for every tray notification
+        self._runner_icon = QIcon(asset_path("sb_runner.svg"))
+        self.setWindowIcon(self._runner_icon)
         self.setFixedSize(260, 460)
+        # Window-level rules are parsed once and inherited by the footer
+        # buttons, context menus and the dialogs parented to this window
+        self.setStyleSheet(
+            "QMenu#buddyContextMenu { color: white; }"
+            "QMenu#buddyContextMenu::item:selected { background: #1e73be; }"
+            # Match Sign On's green-accented border style
+            "QPushButton#footerButton { border: 1px solid #6ee7b7; border-radius: 4px; padding: 4px 10px; }"
+            "QPushButton#footerButton:hover { border-color: #10b981; }"
+            "QInputDialog QLabel, QMessageBox QLabel { color: black; }"
+        )
 
         central = QWidget(self)
         self.setCentralWidget(central)
@@ -61,8 +91,21 @@ class BuddyListWindow(QMainWindow):
         self.tree = QTreeWidget()
         self.tree.setHeaderHidden(True)
         self.tree.setRootIsDecorated(False)
+        self.tree.setItemDelegate(_BuddyDelegate(self.tree))
+        # Open a message window on buddy double-click
+        self.tree.itemDoubleClicked.connect(self._open_message_for_item)
         root.addWidget(self.tree, 1)
 
+        # Buddy rows by screen name, and the status each row currently shows
+        self._buddy_items: dict[str, QTreeWidgetItem] = {}
+        self._buddy_status: dict[str, str] = {}
+        self._groups: dict[str, QTreeWidgetItem] = {}
+        self._buddy_flags: dict[str, dict] = {}
+        # (monotonic fetch time, entries) of the last server buddy list
+        self._buddies_cache: tuple[float, list] | None = None
+        # Open conversations by peer screen name
+        self._open_msgs: dict[str, MessageWindow] = {}
+
         # Sample data (placeholder)
         self._populate_sample()
 
@@ -74,19 +117,14 @@ class BuddyListWindow(QMainWindow):
         footer = QHBoxLayout()
         self.add_btn = QPushButton("&Add Buddy")
         self.signoff_btn = QPushButton("Sign &Off")
-        # Match Sign On's green-accented border style
-        self.add_btn.setStyleSheet(
-            "QPushButton { border: 1px solid #6ee7b7; border-radius: 4px; padding: 4px 10px; }"
-            "QPushButton:hover { border-color: #10b981; }"
-        )
-        self.signoff_btn.setStyleSheet(
-            "QPushButton { border: 1px solid #6ee7b7; border-radius: 4px; padding: 4px 10px; }"
-            "QPushButton:hover { border-color: #10b981; }"
-        )
+        self.add_btn.setObjectName("footerButton")
+        self.signoff_btn.setObjectName("footerButton")
         footer.addWidget(self.add_btn)
         footer.addStretch(1)
         self.conn_label = QLabel("Connected")
         self.conn_label.setStyleSheet("QLabel { color: #666666; }")
+        # Last state shown; every heartbeat reports one, mostly unchanged
+        self._conn_state: str | None = None
         footer.addWidget(self.conn_label)
         footer.addWidget(self.signoff_btn)
         root.addLayout(footer)
@@ -99,24 +137,63 @@ class BuddyListWindow(QMainWindow):
         # Networking worker thread (smooth UI)
         self._base_url = load_settings().get("server_url", "http://127.0.0.1:5000")
         self._session = QApplication.instance().property("sb_session")
-        self._net_thread = QThread(self)
-        # Track last user activity (typing status message or focusing window)
-        self._last_input = time.time()
-        self.status_edit.textChanged.connect(lambda: setattr(self, "_last_input", time.time()))
+        # Buddy-list actions get their own keep-alive session on pool threads
+        # (message windows use the signed-in session on the UI thread); it
+        # shares the login cookies so requests stay authenticated.
+        self._http = requests.Session()
+        # Only a gateway hiccup on an idempotent GET is retried. Connect and
+        # read failures fail at once, so a dead server costs one connect
+        # timeout rather than three; urllib3 already replaces pooled
+        # connections it finds dropped before reusing them.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=2, connect=0, read=0, status_forcelist=(502, 503, 504), backoff_factor=0.3),
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        if self._session is not None:
+            self._http.cookies = self._session.cookies
+        # Track user activity (typing a status message): active until a minute
+        # passes without input, so the worker's check is a plain flag read
+        self._active = True
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(60_000)
+        self._idle_timer.timeout.connect(self._on_idle)
+        self._idle_timer.start()
+        self.status_edit.textChanged.connect(self._on_user_input)
         self._net_worker = _NetWorker(
             self._base_url,
             self.local_screen_name,
             self._session,
-            get_active=lambda: (time.time() - getattr(self, "_last_input", 0)) < 60,
+            get_active=lambda: self._active,
             get_names=lambda: list((self._buddy_flags or {}).keys()),
+            get_chatting=lambda: any(w.isVisible() for w in self._open_msgs.values()),
+            parent=self,
         )
-        self._net_worker.moveToThread(self._net_thread)
-        self._net_thread.started.connect(self._net_worker.run)
         self._net_worker.messages.connect(self._on_messages)
         self._net_worker.online.connect(self._on_online)
         self._net_worker.typing.connect(self._on_typing)
         self._net_worker.state.connect(self._on_state)
-        self._net_thread.start()
+        self._is_hidden = False
+        self._hidden_changed.connect(self._net_worker.set_hidden)
+        self._net_worker.start()
+        # One-off buddy-list calls reuse QThreadPool threads; results come back
+        # on the UI thread. Fetches are numbered so a slow, older response
+        # can't overwrite a newer one.
+        self._buddy_api = _BuddyApi(self._base_url, self._http)
+        self._in_flight: set[_HttpRunnable] = set()
+        self._fetch_seq = 0
+        self._applied_seq = 0
+        # Last server list and its ETag, replayed when the server answers 304
+        self._server_buddies: list = []
+        self._buddies_etag: str | None = None
+        # Buddy adds/removes waiting for the debounce to send them as one batch
+        self._pending_ops: list[dict] = []
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(200)
+        self._batch_timer.timeout.connect(self._flush_ops)
         # Initial fetch of buddies from server
         self._refresh_buddies()
 
@@ -126,47 +203,72 @@ class BuddyListWindow(QMainWindow):
             "Work": [("patricia", True)],
             "Family": [("mom", False), ("dad", True)],
         }
+        # Always starts from an empty tree, so repeated fallbacks can't stack
+        # duplicate samples
+        self.tree.clear()
+        self._buddy_items.clear()
+        self._buddy_status.clear()
+        self._groups.clear()
+        self._buddy_flags = {}
+        # Build the whole tree detached, then insert it in one go so the view
+        # lays out once instead of once per item.
+        group_items = []
         for group_name, buddies in groups.items():
             group_item = QTreeWidgetItem([group_name])
             group_item.setFirstColumnSpanned(True)
             group_item.setFlags(group_item.flags() & ~Qt.ItemIsSelectable)
-            self.tree.addTopLevelItem(group_item)
+            children = []
             for name, online in buddies:
-                label = f"{name} {'(online)' if online else '(away)'}"
-                child = QTreeWidgetItem([label])
-                group_item.addChild(child)
-            group_item.setExpanded(True)
-
-        # Open a message window on buddy double-click
-        self.tree.itemDoubleClicked.connect(self._open_message_for_item)
+                status = "online" if online else "away"
+                child = QTreeWidgetItem([name])
+                child.setData(0, Qt.UserRole, name)
+                child.setData(0, _STATUS_ROLE, status)
+                children.append(child)
+                self._buddy_items[name] = child
+                self._buddy_status[name] = status
+            group_item.addChildren(children)
+            group_items.append(group_item)
+            self._groups[group_name] = group_item
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            self.tree.addTopLevelItems(group_items)
+            for group_item in group_items:
+                group_item.setExpanded(True)
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
 
+    @Slot(QTreeWidgetItem, int)
     def _open_message_for_item(self, item: QTreeWidgetItem, column: int) -> None:
         if item.childCount() > 0:
             return
-        label = item.text(0)
-        screen_name = label.split(" ", 1)[0]
+        screen_name = _item_screen_name(item)
         # Reuse existing window if already open
-        if not hasattr(self, "_open_msgs"):
-            self._open_msgs = []
-        for w in self._open_msgs:
-            if getattr(w, "peer_screen_name", "") == screen_name:
-                w.show()
-                w.raise_()
-                w.activateWindow()
-                return
+        w = self._open_msgs.get(screen_name)
+        if w is not None:
+            w.show()
+            w.raise_()
+            w.activateWindow()
+            return
+        self._open_message_window(screen_name)
+
+    def _open_message_window(self, screen_name: str) -> MessageWindow:
         msg = MessageWindow(screen_name, self.local_screen_name)
         msg.show()
-        self._open_msgs.append(msg)
+        self._open_msgs[screen_name] = msg
+        msg.destroyed.connect(lambda _=None, n=screen_name: self._open_msgs.pop(n, None))
+        return msg
 
+    @Slot()
     def _handle_signoff(self) -> None:
         # Close any open message windows
-        if hasattr(self, "_open_msgs"):
-            for w in list(self._open_msgs):
-                try:
-                    w.close()
-                except Exception:
-                    pass
-            self._open_msgs.clear()
+        for w in list(self._open_msgs.values()):
+            try:
+                w.close()
+            except Exception:
+                pass
+        self._open_msgs.clear()
         # Notify parent and close
         if callable(self._on_signoff):
             try:
@@ -176,129 +278,258 @@ class BuddyListWindow(QMainWindow):
         self.close()
 
     # --- Networking ---
+    @Slot(list)
     def _on_messages(self, msgs: list[dict]) -> None:
+        # Group a polled burst by sender so each conversation is looked up and
+        # notified once, with its messages appended in arrival order
+        by_sender: dict[str, list[tuple[str, str]]] = {}
         for m in msgs or []:
-            sender = m.get("from") or "buddy"
-            text = m.get("content") or ""
-            html = m.get("content_html") or ""
-            self._deliver_incoming(sender, text, html)
-
-    def _deliver_incoming(self, sender: str, text: str, html: str = "") -> None:
-        # Notify via tray
+            get = m.get
+            by_sender.setdefault(get("from") or "buddy", []).append((get("content") or "", get("content_html") or ""))
+        if not by_sender:
+            return
         tray = QApplication.instance().property("sb_tray")
-        if tray:
-            # Respect mute flag
-            flags = (self._buddy_flags or {}).get(sender, {})
-            if not bool(flags.get("muted")):
-                tray.showMessage(sender, text[:80], QIcon(asset_path("sb_runner.svg")), 2500)
+        for sender, items in by_sender.items():
+            self._deliver_incoming(sender, items, tray)
+
+    def _deliver_incoming(self, sender: str, items: list[tuple[str, str]], tray=None) -> None:
+        flags = self._buddy_flags.get(sender, {})
+        # Notify via tray (once per burst, with the latest message), respecting mute
+        if tray and not flags.get("muted"):
+            tray.showMessage(sender, items[-1][0][:80], self._runner_icon, 2500)
         # Drop entirely if blocked
-        flags = (self._buddy_flags or {}).get(sender, {})
-        if bool(flags.get("blocked")):
+        if flags.get("blocked"):
             return
         # Open or find message window
-        if not hasattr(self, "_open_msgs"):
-            self._open_msgs = []
-        target = None
-        for w in self._open_msgs:
-            if getattr(w, "peer_screen_name", "") == sender:
-                target = w
-                break
+        target = self._open_msgs.get(sender)
         if target is None:
-            msg = MessageWindow(sender, self.local_screen_name)
-            msg.show()
-            self._open_msgs.append(msg)
-            target = msg
+            target = self._open_message_window(sender)
         # Append incoming
-        if hasattr(target, "append_incoming"):
-            target.append_incoming(text, html)
+        append = target.append_incoming
+        for text, html in items:
+            append(text, html)
 
+    @Slot(object)
     def _on_online(self, statuses: object) -> None:
-        # Update status (online/away/offline) and preserve flags
+        # Update status (online/away/offline) and preserve flags; only rows
+        # whose status changed are relabelled, in one batched repaint
         try:
             names = statuses or {}
-            for i in range(self.tree.topLevelItemCount()):
-                group = self.tree.topLevelItem(i)
-                for j in range(group.childCount()):
-                    child = group.child(j)
-                    base = (child.text(0).split(" ", 1)[0]).strip()
-                    state = str(names.get(base, "offline"))
-                    status = {"online": "(online)", "away": "(away)", "offline": "(offline)"}.get(state, "(offline)")
-                    # Preserve flags in the label
-                    flags = (self._buddy_flags or {}).get(base, {})
-                    tag = ""
-                    if bool(flags.get("blocked")):
-                        tag = " [blocked]"
-                    elif bool(flags.get("muted")):
-                        tag = " [muted]"
-                    child.setText(0, f"{base} {status}{tag}")
+            changed = []
+            for base, child in self._buddy_items.items():
+                state = names.get(base, "offline")
+                if state not in _LIVE_STATUSES:
+                    state = "offline"
+                if self._buddy_status.get(base) != state:
+                    changed.append((base, child, state))
+            if not changed:
+                return
+            self.tree.setUpdatesEnabled(False)
+            try:
+                for base, child, state in changed:
+                    # Flags live in their own role, so only the status changes
+                    child.setData(0, _STATUS_ROLE, state)
+                    self._buddy_status[base] = state
+            finally:
+                self.tree.setUpdatesEnabled(True)
         except Exception:
             pass
 
+    @Slot(list)
     def _on_typing(self, typers: list[str]) -> None:
         # Show typing indicator on corresponding message windows
-        if not hasattr(self, "_open_msgs"):
-            return
         for name in typers or []:
-            for w in self._open_msgs:
-                if getattr(w, "peer_screen_name", "") == name and hasattr(w, "statusBar"):
-                    w.statusBar().showMessage(f"{name} is typing…", 1500)
+            w = self._open_msgs.get(name)
+            if w is not None:
+                w.statusBar().showMessage(f"{name} is typing…", 1500)
 
+    @Slot(str)
     def _on_state(self, st: str) -> None:
-        if not hasattr(self, "conn_label"):
+        if st == self._conn_state:
             return
-        if st == "connected":
-            self.conn_label.setText("Connected")
-            self.conn_label.setStyleSheet("QLabel { color: #16a34a; }")
-        elif st == "reconnecting":
-            self.conn_label.setText("Reconnecting…")
-            self.conn_label.setStyleSheet("QLabel { color: #ca8a04; }")
-        elif st == "unauthorized":
-            self.conn_label.setText("Unauthorized")
-            self.conn_label.setStyleSheet("QLabel { color: #dc2626; }")
-        else:
-            self.conn_label.setText(st)
-            self.conn_label.setStyleSheet("QLabel { color: #666666; }")
+        # setStyleSheet re-polishes the label, so only touch it on a change
+        prev, self._conn_state = self._conn_state, st
+        text, qss = _STATE_LABELS.get(st, (st, "QLabel { color: #666666; }"))
+        self.conn_label.setText(text)
+        self.conn_label.setStyleSheet(qss)
+        if st == "connected" and prev == "reconnecting":
+            # Edits made elsewhere while we were cut off; refetch once stale
+            self._refresh_buddies()
+
+    # Presence polling slows down while the list is hidden or minimized
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._update_hidden()
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        self._update_hidden()
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        super().hideEvent(event)
+        self._update_hidden()
+
+    @Slot()
+    def _on_user_input(self) -> None:
+        self._active = True
+        self._idle_timer.start()
+
+    @Slot()
+    def _on_idle(self) -> None:
+        self._active = False
+
+    def _update_hidden(self) -> None:
+        hidden = self.isMinimized() or not self.isVisible()
+        if hidden != self._is_hidden:
+            self._is_hidden = hidden
+            self._hidden_changed.emit(hidden)
+            if not hidden:
+                # Restored from the tray or taskbar: revalidate if the list is stale
+                self._refresh_buddies()
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         # Ensure worker stops
         try:
+            # Don't drop adds/removes still waiting on the batch debounce
+            self._batch_timer.stop()
+            self._flush_ops()
             self._net_worker.stop()
-            self._net_thread.quit()
-            self._net_thread.wait(1500)
+            self._http.close()
         except Exception:
             pass
         super().closeEvent(event)
 
     def _refresh_buddies(self) -> None:
-        # Fetch buddies from server and render groups
+        # Fetched on a pool thread; the result arrives via _apply_buddies.
+        # A recent list is shown straight away and only revalidated once stale.
+        if self._buddies_cache is not None:
+            fetched_at, cached = self._buddies_cache
+            self._render_buddies(cached)
+            if time.monotonic() - fetched_at < _BUDDIES_TTL:
+                return
+        self._fetch_buddies()
+
+    def _run_http(self, fn, on_done) -> None:
+        job = _HttpRunnable(fn, on_done)
+        job.signals.done.connect(lambda _=None, j=job: self._in_flight.discard(j))
+        self._in_flight.add(job)
+        QThreadPool.globalInstance().start(job)
+
+    def _fetch_buddies(self) -> None:
+        self._fetch_seq += 1
+        seq = self._fetch_seq
+        etag = self._buddies_etag
+        self._run_http(lambda: self._buddy_api.fetch_buddies(etag), lambda res, seq=seq: self._on_fetched(seq, res))
+
+    def _on_fetched(self, seq: int, res: object) -> None:
+        if seq < self._applied_seq:
+            return
+        self._applied_seq = seq
+        if res is None:
+            self._apply_buddies(None)
+            return
+        etag, buddies = res
+        if buddies is not None:
+            self._server_buddies, self._buddies_etag = buddies, etag
+        # Applied on 304 too, so an optimistic edit the server refused rolls back
+        self._apply_buddies(self._server_buddies)
+
+    @Slot(object)
+    def _after_edit(self, reached: object) -> None:
+        if reached:
+            self._fetch_buddies()
+
+    def _apply_buddies(self, buddies: object) -> None:
+        if buddies is not None:
+            self._buddies_cache = (time.monotonic(), buddies)
+        self._render_buddies(buddies)
+
+    def _apply_local(self, edit) -> None:
+        # Show a buddy-list edit before the server confirms it; the worker
+        # refetches after every edit, and that list replaces this guess
+        if self._buddies_cache is None:
+            return
+        fetched_at, cached = self._buddies_cache
+        entries = [e for e in (edit(dict(entry)) for entry in cached) if e is not None]
+        self._buddies_cache = (fetched_at, entries)
+        self._render_buddies(entries)
+
+    def _render_buddies(self, buddies: object) -> None:
+        # Render groups from a fetched buddy list (None when the fetch failed)
+        if buddies is None:
+            # fallback to sample on error, but keep a list we already have
+            if not self._buddy_items:
+                self._populate_sample()
+            return
         try:
-            sess = self._session or requests.Session()
-            r = sess.get(f"{self._base_url}/api/buddies", timeout=5)
-            data = r.json() if r.ok else {}
-            buddies = data.get("buddies", [])
-            self.tree.clear()
-            group_map: dict[str, QTreeWidgetItem] = {}
-            self._buddy_flags = {}
+            # name -> (group, status, flag) as the server reports it now, and
+            # the flag dicts, decoded together in one pass over the entries.
+            # The server sends muted/blocked as 0/1 ints, so truthiness is enough.
+            wanted: dict[str, tuple[str, str, str]] = {}
+            flags: dict[str, dict] = {}
             for entry in buddies:
-                bname = entry.get("buddy") or ""
-                grp = entry.get("group") or "Buddies"
-                muted = bool(int(entry.get("muted", 0)))
-                blocked = bool(int(entry.get("blocked", 0)))
-                self._buddy_flags[bname] = {"muted": muted, "blocked": blocked}
-                if grp not in group_map:
-                    group_item = QTreeWidgetItem([grp])
-                    group_item.setFirstColumnSpanned(True)
-                    group_item.setFlags(group_item.flags() & ~Qt.ItemIsSelectable)
-                    self.tree.addTopLevelItem(group_item)
-                    group_item.setExpanded(True)
-                    group_map[grp] = group_item
-                suffix = " (away)"
-                if blocked:
-                    suffix += " [blocked]"
-                elif muted:
-                    suffix += " [muted]"
-                child = QTreeWidgetItem([f"{bname}{suffix}"])
-                group_map[grp].addChild(child)
+                get = entry.get
+                bname = get("buddy") or ""
+                muted = bool(get("muted"))
+                blocked = bool(get("blocked"))
+                flags[bname] = {"muted": muted, "blocked": blocked}
+                wanted[bname] = (
+                    get("group") or "Buddies",
+                    get("status") or "away",
+                    "blocked" if blocked else ("muted" if muted else ""),
+                )
+            self._buddy_flags = flags
+            # Patch the existing tree rather than clearing it, so unchanged rows
+            # (and their selection/scroll position) survive a refresh
+            root = self.tree.invisibleRootItem()
+            # New rows are collected per group and inserted in one addChildren
+            # call each, so the model notifies once per group, not once per row
+            new_groups: list[QTreeWidgetItem] = []
+            new_children: dict[str, list[QTreeWidgetItem]] = {}
+            self.tree.setUpdatesEnabled(False)
+            self.tree.blockSignals(True)
+            try:
+                for bname, child in list(self._buddy_items.items()):
+                    want = wanted.get(bname)
+                    parent = child.parent()
+                    if want is None or parent is None or parent.text(0) != want[0]:
+                        (parent or root).removeChild(child)
+                        del self._buddy_items[bname]
+                        self._buddy_status.pop(bname, None)
+                for bname, (grp, status, flag) in wanted.items():
+                    child = self._buddy_items.get(bname)
+                    if child is None:
+                        group_item = self._groups.get(grp)
+                        if group_item is None:
+                            group_item = QTreeWidgetItem([grp])
+                            group_item.setFirstColumnSpanned(True)
+                            group_item.setFlags(group_item.flags() & ~Qt.ItemIsSelectable)
+                            new_groups.append(group_item)
+                            self._groups[grp] = group_item
+                        child = QTreeWidgetItem([bname])
+                        child.setData(0, Qt.UserRole, bname)
+                        new_children.setdefault(grp, []).append(child)
+                        self._buddy_items[bname] = child
+                    if self._buddy_status.get(bname) != status:
+                        child.setData(0, _STATUS_ROLE, status)
+                        self._buddy_status[bname] = status
+                    if child.data(0, _FLAG_ROLE) != flag:
+                        child.setData(0, _FLAG_ROLE, flag)
+                for grp, kids in new_children.items():
+                    self._groups[grp].addChildren(kids)
+                if new_groups:
+                    self.tree.addTopLevelItems(new_groups)
+                    # expanding only takes effect once the item is in the tree
+                    for group_item in new_groups:
+                        group_item.setExpanded(True)
+                for grp, group_item in list(self._groups.items()):
+                    if group_item.childCount() == 0:
+                        root.removeChild(group_item)
+                        del self._groups[grp]
+            finally:
+                self.tree.blockSignals(False)
+                self.tree.setUpdatesEnabled(True)
             if not buddies:
                 # keep sample if empty
                 self._populate_sample()
@@ -306,13 +537,13 @@ class BuddyListWindow(QMainWindow):
             # fallback to sample on error
             self._populate_sample()
 
+    @Slot()
     def _add_buddy_dialog(self) -> None:
         # Screen name prompt with black label
         name_dlg = QInputDialog(self)
         name_dlg.setWindowTitle("Add Buddy")
         name_dlg.setLabelText("Screen name:")
         name_dlg.setInputMode(QInputDialog.TextInput)
-        name_dlg.setStyleSheet("QInputDialog QLabel { color: black; }")
         ok = name_dlg.exec()
         name = name_dlg.textValue()
         if not ok or not name.strip():
@@ -322,56 +553,52 @@ class BuddyListWindow(QMainWindow):
         group_dlg.setWindowTitle("Add Buddy")
         group_dlg.setLabelText("Group (optional):")
         group_dlg.setInputMode(QInputDialog.TextInput)
-        group_dlg.setStyleSheet("QInputDialog QLabel { color: black; }")
         ok = group_dlg.exec()
         group = group_dlg.textValue()
         if not ok:
             return
-        try:
-            payload = {"buddy": name.strip(), "group": (group.strip() or None)}
-            sess = self._session or requests.Session()
-            r = sess.post(f"{self._base_url}/api/buddies", json=payload, timeout=5)
-            if r.ok and (r.headers.get("content-type","").startswith("application/json")) and (r.json().get("ok")):
-                self._refresh_buddies()
-            else:
-                # Try to extract server error for user-friendly message
-                err = ""
-                try:
-                    data = r.json()
-                    err = data.get("error") or ""
-                except Exception:
-                    pass
-                if r.status_code == 404 and not err:
-                    err = "User not found."
-                if r.status_code == 401 and not err:
-                    err = "Please sign in again."
-                if not err:
-                    err = f"Could not add buddy (HTTP {r.status_code})."
-                mb = QMessageBox(self)
-                mb.setWindowTitle("Add Buddy")
-                mb.setText(err)
-                mb.setIcon(QMessageBox.Warning)
-                mb.setStyleSheet("QMessageBox QLabel { color: black; }")
-                mb.exec()
-        except Exception:
-            mb = QMessageBox(self)
-            mb.setWindowTitle("Add Buddy")
-            mb.setText("Network error. Please try again.")
-            mb.setIcon(QMessageBox.Warning)
-            mb.setStyleSheet("QMessageBox QLabel { color: black; }")
-            mb.exec()
+        name, group = name.strip(), group.strip() or None
+        self._queue_op({"op": "add", "buddy": name, "group": group})
+
+    def _queue_op(self, op: dict) -> None:
+        # Adds/removes made in quick succession go out as one batch request
+        self._pending_ops.append(op)
+        self._batch_timer.start()
+
+    @Slot()
+    def _flush_ops(self) -> None:
+        ops, self._pending_ops = self._pending_ops, []
+        if ops:
+            title = _ops_title(ops)
+            self._run_http(lambda: self._buddy_api.apply_ops(ops), lambda res: self._on_ops_done(res, title))
+
+    def _on_ops_done(self, res: object, title: str) -> None:
+        reached, errors = res
+        if errors:
+            self._show_op_error(title, "\n".join(errors))
+        if reached:
+            # One refetch for the whole batch; also rolls back refused removes
+            self._fetch_buddies()
 
+    def _show_op_error(self, title: str, err: str) -> None:
+        mb = QMessageBox(self)
+        mb.setWindowTitle(title)
+        mb.setText(err)
+        mb.setIcon(QMessageBox.Warning)
+        mb.exec()
+
+    @Slot(QPoint)
     def _open_context_menu(self, pos) -> None:
         item = self.tree.itemAt(pos)
         if not item:
             return
         menu = QMenu(self)
-        menu.setStyleSheet("QMenu { color: white; } QMenu::item:selected { background: #1e73be; }")
+        menu.setObjectName("buddyContextMenu")
         if item.childCount() > 0:  # group
             grp_name = item.text(0)
             menu.addAction("Rename Group...", lambda: self._rename_group(grp_name))
         else:  # buddy
-            name = (item.text(0).split(" ", 1)[0]).strip()
+            name = _item_screen_name(item)
             menu.addAction("Remove Buddy", lambda: self._remove_buddy(item))
             flags = (self._buddy_flags or {}).get(name, {})
             muted = bool(flags.get("muted"))
@@ -387,26 +614,23 @@ class BuddyListWindow(QMainWindow):
         menu.exec(self.tree.viewport().mapToGlobal(pos))
 
     def _remove_buddy(self, item: QTreeWidgetItem) -> None:
-        name = (item.text(0).split(" ", 1)[0]).strip()
-        try:
-            sess = self._session or requests.Session()
-            r = sess.delete(f"{self._base_url}/api/buddies", json={"buddy": name}, timeout=5)
-            if r.ok:
-                self._refresh_buddies()
-        except Exception:
-            pass
+        name = _item_screen_name(item)
+        self._apply_local(lambda e: None if e.get("buddy") == name else e)
+        self._queue_op({"op": "remove", "buddy": name})
 
     def _rename_group(self, old: str) -> None:
         new, ok = QInputDialog.getText(self, "Rename Group", f"New name for '{old}':")
         if not ok or not new.strip() or new.strip() == old:
             return
-        try:
-            sess = self._session or requests.Session()
-            r = sess.post(f"{self._base_url}/api/buddies/rename_group", json={"old_group": old, "new_group": new.strip()}, timeout=5)
-            if r.ok:
-                self._refresh_buddies()
-        except Exception:
-            pass
+        new = new.strip()
+
+        def edit(e: dict) -> dict:
+            if (e.get("group") or "Buddies") == old:
+                e["group"] = new
+            return e
+
+        self._apply_local(edit)
+        self._run_http(lambda: self._buddy_api.rename_group(old, new), self._after_edit)
 
     def _set_flags(self, name: str, muted: bool | None = None, blocked: bool | None = None) -> None:
         payload = {"buddy": name}
@@ -414,104 +638,515 @@ class BuddyListWindow(QMainWindow):
             payload["muted"] = muted
         if blocked is not None:
             payload["blocked"] = blocked
+
+        def edit(e: dict) -> dict:
+            if e.get("buddy") == name:
+                e.update({k: int(v) for k, v in payload.items() if k != "buddy"})
+            return e
+
+        self._apply_local(edit)
+        self._run_http(lambda: self._buddy_api.set_flags(payload), self._after_edit)
+
+
+# Buddy rows keep only the screen name as their text; status and flags are
+# separate roles that _BuddyDelegate renders as the "(online) [muted]" suffix.
+_STATUS_ROLE = Qt.UserRole + 1
+_FLAG_ROLE = Qt.UserRole + 2
+# (status, flag) -> rendered suffix, built once instead of per paint
+_ROW_SUFFIX = {
+    (status, flag): f" ({status}) [{flag}]" if flag else f" ({status})"
+    for status in ("online", "away", "offline")
+    for flag in ("", "muted", "blocked")
+}
+
+
+class _BuddyDelegate(QStyledItemDelegate):
+    def initStyleOption(self, option, index) -> None:  # type: ignore[override]
+        super().initStyleOption(option, index)
+        status = index.data(_STATUS_ROLE)
+        if status:
+            flag = index.data(_FLAG_ROLE) or ""
+            suffix = _ROW_SUFFIX.get((status, flag))
+            if suffix is None:
+                suffix = f" ({status}) [{flag}]" if flag else f" ({status})"
+            option.text += suffix
+
+
+def _item_screen_name(item: QTreeWidgetItem) -> str:
+    name = item.data(0, Qt.UserRole)
+    if name:
+        return str(name)
+    return item.text(0).strip()
+
+
+# (connect, read) seconds: an unreachable server fails in 3s, not the full read timeout
+_HTTP_TIMEOUT = (3, 5)
+# Error-box title for a batch made only of one kind of op
+_OP_TITLES = {"add": "Add Buddy", "remove": "Remove Buddy"}
+_NETWORK_ERROR = "Network error. Please try again."
+
+
+def _ops_title(ops: list[dict]) -> str:
+    kinds = {op.get("op") for op in ops}
+    return _OP_TITLES.get(kinds.pop(), "Update Buddies") if len(kinds) == 1 else "Update Buddies"
+
+
+class _HttpSignals(QObject):
+    done = Signal(object)
+
+
+class _HttpRunnable(QRunnable):
+    """Runs one blocking HTTP call on a pool thread and reports back via a queued signal."""
+
+    def __init__(self, fn, on_done) -> None:
+        super().__init__()
+        # Kept alive by the window's in-flight set rather than by the pool
+        self.setAutoDelete(False)
+        self._fn = fn
+        self.signals = _HttpSignals()
+        self.signals.done.connect(on_done)
+
+    def run(self) -> None:
+        self.signals.done.emit(self._fn())
+
+
+class _BuddyApi:
+    """Blocking buddy-list endpoints; each call runs on a shared pool thread."""
+
+    def __init__(self, base_url: str, session) -> None:
+        self.base_url = base_url
+        self._session = session
+
+    def fetch_buddies(self, etag: str | None) -> tuple[str | None, list | None] | None:
+        # (etag, entries) on 200, (etag, None) on 304, None if the fetch failed
         try:
-            sess = self._session or requests.Session()
-            r = sess.post(f"{self._base_url}/api/buddies/set_flags", json=payload, timeout=5)
-            if r.ok:
-                self._refresh_buddies()
+            headers = {"If-None-Match": etag} if etag else None
+            r = self._session.get(f"{self.base_url}/api/buddies", headers=headers, timeout=_HTTP_TIMEOUT)
+            if r.status_code == 304:
+                return etag, None
+            data = _response_json(r) if r.ok else {}
+            return (r.headers.get("ETag") if r.ok else None), data.get("buddies", [])
         except Exception:
-            pass
+            return None
+
+    def add_buddy(self, name: str, group: object) -> str:
+        # "" on success, otherwise a user-facing error for the failed add
+        try:
+            r = self._session.post(f"{self.base_url}/api/buddies", json={"buddy": name, "group": group}, timeout=_HTTP_TIMEOUT)
+            data = _response_json(r)
+            if r.ok and data.get("ok"):
+                return ""
+            # Try to extract server error for user-friendly message
+            err = data.get("error") or ""
+            if r.status_code == 404 and not err:
+                err = "User not found."
+            if r.status_code == 401 and not err:
+                err = "Please sign in again."
+            if not err:
+                err = f"Could not add buddy (HTTP {r.status_code})."
+            return err
+        except Exception:
+            return _NETWORK_ERROR
+
+    def apply_ops(self, ops: list[dict]) -> tuple[bool, list[str]]:
+        # (server answered, user-facing errors) for a batch of add/remove ops;
+        # only adds report per-op refusals, a refused remove is rolled back by the refetch
+        try:
+            r = self._session.post(f"{self.base_url}/api/buddies/batch", json={"ops": ops}, timeout=_HTTP_TIMEOUT)
+        except Exception:
+            return False, [_NETWORK_ERROR]
+        if r.status_code == 404:
+            # Older server without the batch endpoint: one call per op over keep-alive
+            return self._apply_ops_sequentially(ops)
+        results = _response_json(r).get("results") if r.ok else None
+        if not isinstance(results, list):
+            if r.status_code == 401:
+                return True, ["Please sign in again."]
+            return True, [f"Could not update buddies (HTTP {r.status_code})."]
+        errors = []
+        for op, res in zip(ops, results):
+            if op.get("op") == "add" and not (res or {}).get("ok"):
+                err = (res or {}).get("error") or "Could not add buddy."
+                errors.append(err if len(ops) == 1 else f"{op.get('buddy')}: {err}")
+        return True, errors
+
+    def _apply_ops_sequentially(self, ops: list[dict]) -> tuple[bool, list[str]]:
+        reached, errors = False, []
+        for op in ops:
+            if op.get("op") == "add":
+                err = self.add_buddy(op.get("buddy") or "", op.get("group"))
+                # Only a network failure means the add never reached the server
+                reached = reached or err != _NETWORK_ERROR
+                if err:
+                    errors.append(err if len(ops) == 1 else f"{op.get('buddy')}: {err}")
+            else:
+                reached = self.remove_buddy(op.get("buddy") or "") or reached
+        return reached, errors
+
+    # The edits below return whether the server answered at all; the window
+    # refetches even when it refused, so an optimistic edit is rolled back.
+    def remove_buddy(self, name: str) -> bool:
+        try:
+            self._session.delete(f"{self.base_url}/api/buddies", json={"buddy": name}, timeout=_HTTP_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    def rename_group(self, old: str, new: str) -> bool:
+        try:
+            self._session.post(f"{self.base_url}/api/buddies/rename_group", json={"old_group": old, "new_group": new}, timeout=_HTTP_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    def set_flags(self, payload: dict) -> bool:
+        try:
+            self._session.post(f"{self.base_url}/api/buddies/set_flags", json=payload, timeout=_HTTP_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+
+# (heartbeat ms, presence check ms) while the buddy list is shown, hidden or
+# minimized, and hidden with no recent input. The first two land inside the
+# server's 20s online window; idle beats are announced as "slow", which gets
+# its 90s window instead
+_CADENCE_VISIBLE = (2500, 7000)
+_CADENCE_HIDDEN = (15000, 60000)
+_CADENCE_IDLE = (60000, 60000)
+# Seconds the server holds a message poll open waiting for new messages
+_POLL_WAIT_S = 25
+# Server rejects presence lookups for more names than this (MAX_PRESENCE_NAMES)
+_PRESENCE_BATCH = 256
+
 
 class _NetWorker(QObject):
+    """Presence, typing and message polling over QNetworkAccessManager.
+
+    Lives on the UI thread: requests complete through Qt's event loop, so each
+    cadence runs on its own timer without blocking the others or the window.
+    """
+
     messages = Signal(list)
     online = Signal(object)  # dict name->status
     typing = Signal(list)
     state = Signal(str)  # "connected"|"reconnecting"|"unauthorized"
 
-    def __init__(self, base_url: str, screen_name: str, session=None, get_active=None, get_names=None) -> None:
-        super().__init__()
+    def __init__(self, base_url: str, screen_name: str, session=None, get_active=None, get_names=None,
+                 get_chatting=None, parent=None) -> None:
+        super().__init__(parent)
         self.base_url = base_url
         self.screen_name = screen_name
         self._running = True
-        self._session = session or requests.Session()
         self._get_active = get_active  # callable -> bool
         self._get_names = get_names    # callable -> list[str]
+        self._get_chatting = get_chatting  # callable -> bool, any message window shown
+        # Messages arrive over the server's SSE stream; servers without it get
+        # the long-poll instead
+        self._use_stream = True
+        self._stream_buf = b""
+        self._stream_retry_ms = 3000
+        self._hidden = False
+        self._connected = False
+        self._backoff = 1.0
+        self._last_statuses: dict | None = None
+        # Per presence batch (index into the chunked buddy names): ETag and
+        # last reported statuses, merged into one map for the online signal
+        self._online_etags: dict[int, str] = {}
+        # Whether the last heartbeat sent told the server to expect slow beats
+        self._hb_slow = False
+        self._batch_statuses: dict[int, dict] = {}
+        self._nam = QNetworkAccessManager(self)
+        if session is not None:
+            self._import_cookies(session)
+        # At most one request in flight per kind; a slow reply skips ticks
+        # instead of stacking requests behind it
+        self._pending: dict[str, QNetworkReply] = {}
+        self._hb_timer = QTimer(self)
+        self._hb_timer.timeout.connect(self._do_heartbeat)
+        self._online_timer = QTimer(self)
+        self._online_timer.timeout.connect(self._do_online)
+        self._typing_timer = QTimer(self)
+        self._typing_timer.timeout.connect(self._do_typing)
+        # The long-poll reschedules itself once each request completes
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.timeout.connect(self._do_poll)
+
+    def _import_cookies(self, session) -> None:
+        # The sign-on requests.Session holds the login cookie; hand it to Qt's jar
+        cookies = []
+        for c in session.cookies:
+            cookie = QNetworkCookie(c.name.encode(), (c.value or "").encode())
+            cookie.setPath(c.path or "/")
+            cookies.append(cookie)
+        self._nam.cookieJar().setCookiesFromUrl(cookies, QUrl(self.base_url))
+
+    def start(self) -> None:
+        hb_ms, online_ms = self._cadence()
+        self._hb_timer.start(hb_ms)
+        self._online_timer.start(online_ms)
+        self._typing_timer.start(1000)
+        self._do_heartbeat()
+        self._poll_timer.start(0)
+
+    def _cadence(self) -> tuple[int, int]:
+        if not self._hidden:
+            return _CADENCE_VISIBLE
+        return _CADENCE_HIDDEN if self._is_active() else _CADENCE_IDLE
+
+    def _next_heartbeat_ms(self) -> int:
+        # Stretch to the idle cadence only once the server has been told the
+        # beats will be slow; until then keep the hidden cadence and announce
+        # it with an immediate beat, so the 20s window can't lapse
+        cadence = self._cadence()
+        if cadence is _CADENCE_IDLE and not self._hb_slow:
+            QTimer.singleShot(0, self._do_heartbeat)
+            return _CADENCE_HIDDEN[0]
+        return cadence[0]
+
+    def _is_active(self) -> bool:
+        try:
+            return bool(self._get_active()) if self._get_active else False
+        except Exception:
+            return False
+
+    @Slot(bool)
+    def set_hidden(self, hidden: bool) -> None:
+        self._hidden = hidden
+        online_ms = self._cadence()[1]
+        if self._connected:
+            # Reconnect backoff owns the heartbeat timer until the next success
+            self._hb_timer.setInterval(self._next_heartbeat_ms())
+        self._online_timer.setInterval(online_ms)
 
     def stop(self) -> None:
+        # Everything is on this thread, so stopping is immediate: no join
         self._running = False
+        for timer in (self._hb_timer, self._online_timer, self._typing_timer, self._poll_timer):
+            timer.stop()
+        for reply in list(self._pending.values()):
+            reply.abort()
+
+    def _send(self, kind: str, path: str, on_done, params: dict | None = None, payload: dict | None = None,
+              headers: dict | None = None, timeout_ms: int = 4000) -> bool:
+        if not self._running or kind in self._pending:
+            return False
+        url = QUrl(f"{self.base_url}{path}")
+        if params:
+            query = QUrlQuery()
+            for key, value in params.items():
+                query.addQueryItem(key, str(value))
+            url.setQuery(query)
+        req = QNetworkRequest(url)
+        req.setTransferTimeout(timeout_ms)
+        for key, value in (headers or {}).items():
+            req.setRawHeader(key.encode(), value.encode())
+        if payload is not None:
+            req.setHeader(QNetworkRequest.ContentTypeHeader, "application/json")
+            reply = self._nam.post(req, orjson.dumps(payload))
+        else:
+            reply = self._nam.get(req)
+        self._pending[kind] = reply
+        reply.finished.connect(lambda: self._finished(kind, reply, on_done))
+        return True
+
+    def _finished(self, kind: str, reply: QNetworkReply, on_done) -> None:
+        self._pending.pop(kind, None)
+        try:
+            if self._running:
+                # None means the request never got an HTTP answer (refused, timed out)
+                status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+                on_done(int(status) if status is not None else None, reply)
+        finally:
+            reply.deleteLater()
+
+    @Slot()
+    def _do_heartbeat(self) -> None:
+        slow = self._cadence() is _CADENCE_IDLE
+        if self._send("heartbeat", "/api/presence/heartbeat", self._on_heartbeat,
+                      payload={"active": self._is_active(), "slow": slow}, timeout_ms=3000):
+            self._hb_slow = slow
+
+    def _on_heartbeat(self, status: int | None, reply: QNetworkReply) -> None:
+        if status is None:
+            self.state.emit("reconnecting")
+            self._connected = False
+            # Retry sooner than the regular cadence, backing off up to 8s
+            self._hb_timer.start(int(min(self._backoff, 8.0) * 1000))
+            self._backoff = min(self._backoff * 2.0, 8.0)
+            return
+        self.state.emit("connected")
+        if not self._connected:
+            self._connected = True
+            self._backoff = 1.0
+            self._hb_timer.start(self._next_heartbeat_ms())
+            self._do_online()
+        elif self._hidden:
+            # Activity moves a hidden window between the hidden and idle cadence
+            hb_ms = self._next_heartbeat_ms()
+            if self._hb_timer.interval() != hb_ms:
+                self._hb_timer.start(hb_ms)
+
+    @Slot()
+    def _do_online(self) -> None:
+        # Online list every 7s
+        if not self._connected:
+            return
+        names = []
         try:
-            self._session.close()
+            if self._get_names:
+                names = list(self._get_names() or [])
         except Exception:
-            pass
+            names = []
+        batches = [names[i:i + _PRESENCE_BATCH] for i in range(0, len(names), _PRESENCE_BATCH)]
+        # Forget batches that no longer exist after the list shrank
+        for store in (self._online_etags, self._batch_statuses):
+            for idx in [k for k in store if k >= len(batches)]:
+                del store[idx]
+        for idx, batch in enumerate(batches):
+            etag = self._online_etags.get(idx)
+            headers = {"If-None-Match": etag} if etag else None
+            self._send(f"online{idx}", "/api/presence/status",
+                       lambda status, reply, idx=idx: self._on_status(idx, status, reply),
+                       payload={"names": batch}, headers=headers)
 
-    def run(self) -> None:
-        last_online_check = 0.0
-        last_typing_check = 0.0
-        backoff = 1.0
-        while self._running:
-            now = time.time()
-            # Heartbeat
-            try:
-                active = False
-                try:
-                    if self._get_active:
-                        active = bool(self._get_active())
-                except Exception:
-                    active = False
-                self._session.post(f"{self.base_url}/api/presence/heartbeat", json={"active": active}, timeout=3)
-                self.state.emit("connected")
-                backoff = 1.0
-            except Exception:
-                self.state.emit("reconnecting")
-                time.sleep(min(backoff, 8.0))
-                backoff = min(backoff * 2.0, 8.0)
-                continue
-            # Online list every 7s
-            if now - last_online_check > 7:
-                try:
-                    names = []
+    def _on_status(self, idx: int, status: int | None, reply: QNetworkReply) -> None:
+        if status == 401:
+            self.state.emit("unauthorized")
+            return
+        if status == 304:
+            # Same names, same statuses: nothing to parse or relabel
+            return
+        if status is None or not 200 <= status < 300:
+            # An error says nothing about presence; keep what is shown
+            return
+        etag = bytes(reply.rawHeader(b"ETag")).decode()
+        if etag:
+            self._online_etags[idx] = etag
+        else:
+            self._online_etags.pop(idx, None)
+        self._batch_statuses[idx] = _reply_json(reply).get("statuses", {})
+        statuses = {}
+        for part in self._batch_statuses.values():
+            statuses.update(part)
+        # Nothing to relabel if presence is exactly as last reported
+        if statuses != self._last_statuses:
+            self._last_statuses = statuses
+            self.online.emit(statuses)
+
+    @Slot()
+    def _do_typing(self) -> None:
+        # Poll typing frequently (~1s), but only while a conversation is on
+        # screen to show the indicator in
+        try:
+            chatting = self._get_chatting() if self._get_chatting else True
+        except Exception:
+            chatting = True
+        if self._connected and chatting:
+            self._send("typing", "/api/messages/typing", self._on_typing, timeout_ms=3000)
+
+    def _on_typing(self, status: int | None, reply: QNetworkReply) -> None:
+        if status is not None and 200 <= status < 300:
+            td = _reply_json(reply)
+            if td.get("typing"):
+                self.typing.emit(td.get("typing"))
+
+    @Slot()
+    def _do_poll(self) -> None:
+        if not self._connected:
+            self._poll_timer.start(1000)
+            return
+        if self._use_stream:
+            self._open_stream()
+            return
+        # The wait happens on the server, not on a thread here, so the poll can
+        # be long; stop() aborts it
+        self._send(
+            "poll",
+            "/api/messages/poll",
+            self._on_poll,
+            params={"screen_name": self.screen_name, "timeout": _POLL_WAIT_S},
+            timeout_ms=(_POLL_WAIT_S + 5) * 1000,
+        )
+
+    def _on_poll(self, status: int | None, reply: QNetworkReply) -> None:
+        delay = 0
+        if status is None:
+            delay = 500
+        elif status == 401:
+            self.state.emit("unauthorized")
+            delay = 2000
+        elif 200 <= status < 300:
+            msgs = _reply_json(reply).get("messages", [])
+            if msgs:
+                self.messages.emit(msgs)
+        if self._running:
+            self._poll_timer.start(delay)
+
+    def _open_stream(self) -> None:
+        if not self._running or "stream" in self._pending:
+            return
+        req = QNetworkRequest(QUrl(f"{self.base_url}/api/messages/stream"))
+        req.setRawHeader(b"Accept", b"text/event-stream")
+        # An inactivity limit: the server sends a keepalive comment every 15s
+        req.setTransferTimeout(45000)
+        reply = self._nam.get(req)
+        self._pending["stream"] = reply
+        self._stream_buf = b""
+        reply.readyRead.connect(lambda: self._on_stream_data(reply))
+        reply.finished.connect(lambda: self._finished("stream", reply, self._on_stream_end))
+
+    def _on_stream_data(self, reply: QNetworkReply) -> None:
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        if status is None or not 200 <= int(status) < 300:
+            return  # error bodies are handled once the reply finishes
+        self._stream_buf += bytes(reply.readAll())
+        *events, self._stream_buf = self._stream_buf.split(b"\n\n")
+        msgs = []
+        for event in events:
+            for line in event.split(b"\n"):
+                if line.startswith(b"data:"):
                     try:
-                        if self._get_names:
-                            names = list(self._get_names() or [])
-                    except Exception:
-                        names = []
-                    if names:
-                        r = self._session.get(f"{self.base_url}/api/presence/status", params={"names": ",".join(names)}, timeout=4)
-                        if r.status_code == 401:
-                            self.state.emit("unauthorized")
-                            time.sleep(2.0)
-                            continue
-                        data = r.json() if r.ok else {}
-                        self.online.emit(data.get("statuses", {}))
-                except Exception:
-                    pass
-                last_online_check = now
-            # Poll typing frequently (~1s)
-            if now - last_typing_check > 1.0:
-                try:
-                    rt = self._session.get(f"{self.base_url}/api/messages/typing", timeout=3)
-                    td = rt.json() if rt.ok else {}
-                    if td.get("typing"):
-                        self.typing.emit(td.get("typing"))
-                except Exception:
-                    pass
-                last_typing_check = now
-            # Short long-poll messages (keep small so we can stop fast)
-            try:
-                r = self._session.get(
-                    f"{self.base_url}/api/messages/poll",
-                    params={"screen_name": self.screen_name, "timeout": 3},
-                    timeout=4,
-                )
-                if r.status_code == 401:
-                    self.state.emit("unauthorized")
-                    time.sleep(2.0)
-                    continue
-                data = r.json() if r.ok else {}
-                msgs = data.get("messages", [])
-                if msgs:
-                    self.messages.emit(msgs)
-            except Exception:
-                time.sleep(0.5)
+                        msg = orjson.loads(line[5:])
+                    except ValueError:
+                        continue
+                    if isinstance(msg, dict):
+                        msgs.append(msg)
+                elif line.startswith(b"retry:") and line[6:].strip().isdigit():
+                    self._stream_retry_ms = int(line[6:])
+        # Everything that arrived in one network read is delivered as one batch
+        if msgs:
+            self.messages.emit(msgs)
+
+    def _on_stream_end(self, status: int | None, reply: QNetworkReply) -> None:
+        delay = self._stream_retry_ms
+        if status == 401:
+            self.state.emit("unauthorized")
+        elif status == 404:
+            # Server predates the stream endpoint
+            self._use_stream = False
+            delay = 0
+        if self._running:
+            self._poll_timer.start(delay)
+
+
+def _reply_json(reply: QNetworkReply) -> dict:
+    # Reply body as a dict; anything empty, non-JSON or malformed reads as empty
+    return _loads_dict(reply.header(QNetworkRequest.ContentTypeHeader), bytes(reply.readAll()))
+
+
+def _response_json(r) -> dict:
+    # Same for a requests response, parsed from the raw bytes
+    return _loads_dict(r.headers.get("content-type"), r.content)
 
 
+def _loads_dict(content_type: object, body: bytes) -> dict:
+    # 304s, proxy error pages and the like are skipped without raising
+    if not body or not str(content_type or "").startswith("application/json"):
+        return {}
+    try:
+        data = orjson.loads(body)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from html import escape
+import re
 
 from PySide6.QtCore import Qt, QEvent, QUrl
 from PySide6.QtGui import (
@@ -11,8 +12,10 @@ from PySide6.QtGui import (
     QTextCharFormat,
     QFont,
     QColor,
-    QTextBlockFormat,
+    QDesktopServices,
+    QTextDocument,
     QTextDocumentFragment,
+    QTextFormat,
 )
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -26,9 +29,10 @@ from PySide6.QtWidgets import (
     QMenuBar,
     QSizePolicy,
     QColorDialog,
-    QInputDialog,
+    QLineEdit,
     QMenu,
-    QTextBrowser,
+    QPlainTextEdit,
+    QToolButton,
 )
 
 from .. import __app_name__
@@ -38,7 +42,83 @@ from PySide6.QtWidgets import QApplication
 from pathlib import Path
 import requests
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, QThreadPool
+
+
+# One transcript block: bold sender, grey timestamp, then the message body
+_MESSAGE_HTML = '<b>%s</b><span style="color:#666666"> (%s)</span>: %s'
+
+_EMOJIS = ("😀", "😃", "😄", "😉", "😊", "😍", "😂", "👍", "🎉", "❤️", "🔥", "🙂", "😎")
+
+# Messages kept on screen; older ones are evicted (transcript logging, when
+# enabled, still has them) so layout work stays bounded in long chats
+_TRANSCRIPT_MAX_BLOCKS = 2000
+
+# Paragraph breaks inside a message fragment; folded into line breaks so a
+# multi-line message stays one transcript block after the sender prefix
+_PARA_BREAK = re.compile(r"</p>\s*<p[^>]*>")
+
+
+def _fragment_html(fragment: QTextDocumentFragment) -> str:
+    # Inline HTML of a fragment: Qt wraps it in a full document, with the
+    # content itself between the StartFragment/EndFragment markers
+    html = fragment.toHtml()
+    start = html.find("<!--StartFragment-->")
+    end = html.find("<!--EndFragment-->")
+    if start < 0 or end < start:
+        return escape(fragment.toPlainText())
+    return _PARA_BREAK.sub("<br />", html[start + len("<!--StartFragment-->"):end])
+
+
+_PLAIN_COLOR = QColor("#000000")
+
+_SEND_POOL: QThreadPool | None = None
+
+
+def _send_pool() -> QThreadPool:
+    # One thread shared by all message windows: posts leave in the order they
+    # were made, so messages can't overtake each other on the way out
+    global _SEND_POOL
+    if _SEND_POOL is None:
+        _SEND_POOL = QThreadPool()
+        _SEND_POOL.setMaxThreadCount(1)
+    return _SEND_POOL
+
+
+def _has_rich_format(doc: QTextDocument) -> bool:
+    # Whether any run is bold, italic, underlined, a link or coloured; the
+    # black that each send resets the typing colour to counts as plain
+    block = doc.firstBlock()
+    while block.isValid():
+        for run in block.textFormats():
+            fmt = run.format
+            if (
+                fmt.isAnchor()
+                or fmt.fontWeight() > QFont.Weight.Normal
+                or fmt.fontItalic()
+                or fmt.fontUnderline()
+                or (fmt.hasProperty(QTextFormat.ForegroundBrush) and fmt.foreground().color() != _PLAIN_COLOR)
+            ):
+                return True
+        block = block.next()
+    return False
+
+
+class _Transcript(QPlainTextEdit):
+    """Read-only, append-only chat log that still opens clicked links."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(_TRANSCRIPT_MAX_BLOCKS)
+        self.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.LinksAccessibleByMouse)
+
+    def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
+        super().mouseReleaseEvent(event)
+        if event.button() == Qt.LeftButton and not self.textCursor().hasSelection():
+            href = self.cursorForPosition(event.position().toPoint()).charFormat().anchorHref()
+            if href:
+                QDesktopServices.openUrl(QUrl(href))
 
 
 class MessageWindow(QMainWindow):
@@ -53,6 +133,11 @@ class MessageWindow(QMainWindow):
         self.setMinimumSize(520, 520)
         self.resize(540, 560)
         self.settings = load_settings()
+        # Transcript timestamps change once a minute; the last one is reused
+        self._ts_24h = self.settings.get("appearance_timestamp_format") == "24h"
+        self._ts_cache: tuple[tuple[int, int], str] | None = None
+        # Only two senders ever appear in a conversation; escape them once
+        self._sender_html = {name: escape(name) for name in (peer_screen_name, local_screen_name)}
 
         # Menu bar (placeholder items for nostalgia)
         self._build_menubar()
@@ -63,10 +148,9 @@ class MessageWindow(QMainWindow):
         root.setContentsMargins(8, 6, 8, 8)
         root.setSpacing(6)
 
-        # Transcript (read-only, supports clicking links)
-        self.transcript = QTextBrowser()
-        self.transcript.setReadOnly(True)
-        self.transcript.setOpenExternalLinks(True)
+        # Transcript (read-only, supports clicking links). A plain-text edit
+        # lays out line by line, so appending stays cheap in long chats.
+        self.transcript = _Transcript()
         self.transcript.setPlaceholderText(f"Chat with {peer_screen_name} will appear here…")
         root.addWidget(self.transcript, 2)
 
@@ -83,6 +167,10 @@ class MessageWindow(QMainWindow):
         if typing_fmt.fontWeight() != QFont.Weight.Normal or typing_fmt.fontItalic():
             self.input.mergeCurrentCharFormat(typing_fmt)
 
+        # Inline link editor under the toolbar, built on first use
+        self._link_bar: QWidget | None = None
+        self._link_edit: QLineEdit | None = None
+
         # Formatting toolbar (lightweight, text-based)
         self.fmt_toolbar = QToolBar()
         self.fmt_toolbar.setIconSize(self.fmt_toolbar.iconSize())  # default
@@ -153,52 +241,57 @@ class MessageWindow(QMainWindow):
         self.act_link.triggered.connect(self._insert_link)
         tb.addAction(self.act_link)
         self.act_emoji = QAction("☺", self)
-        self.act_emoji.triggered.connect(self._show_emoji_menu)
         tb.addAction(self.act_emoji)
-
-        # Keep toolbar toggles in sync with cursor
-        self.input.cursorPositionChanged.connect(self._sync_toolbar_from_cursor)
+        # Built once; the toolbar button pops it up itself, so a click costs no
+        # menu construction or geometry lookups
+        self._emoji_menu = QMenu(self)
+        for e in _EMOJIS:
+            self._emoji_menu.addAction(e).setData(e)
+        self._emoji_menu.triggered.connect(self._on_emoji_action)
+        self.act_emoji.setMenu(self._emoji_menu)
+        emoji_btn = tb.widgetForAction(self.act_emoji)
+        if isinstance(emoji_btn, QToolButton):
+            emoji_btn.setPopupMode(QToolButton.InstantPopup)
+
+        # Keep toolbar toggles in sync with cursor; a burst of cursor moves
+        # (typing, or a format toggle resetting the cursor) syncs once per loop pass
+        self._sync_pending = False
+        self.input.cursorPositionChanged.connect(self._schedule_toolbar_sync)
 
     def _append_to_transcript(self, sender: str, text: str | None = None, fragment: QTextDocumentFragment | None = None) -> None:
         """Append a message like: You (9:12 PM): message, with wrapping."""
-        timestamp = datetime.now().strftime("%I:%M %p").lstrip("0")
-
-        cursor = self.transcript.textCursor()
-        cursor.movePosition(QTextCursor.End)
-
-        # Begin a new paragraph for this message with tight spacing
-        block_fmt = QTextBlockFormat()
-        block_fmt.setTopMargin(2)
-        block_fmt.setBottomMargin(2)
-        cursor.insertBlock(block_fmt)
-
-        # Sender (bold)
-        sender_fmt = QTextCharFormat()
-        sender_fmt.setFontWeight(QFont.Weight.Bold)
-        cursor.insertText(sender, sender_fmt)
-
-        # Space + timestamp (grey)
-        ts_fmt = QTextCharFormat()
-        ts_fmt.setForeground(QColor("#666666"))
-        cursor.insertText(f" ({timestamp})", ts_fmt)
-
-        # Colon + space and the actual message (rich or plain, wraps automatically)
-        cursor.insertText(": ")
+        timestamp = self._timestamp()
+        # One block per message: bold sender, grey timestamp, then the message
+        # (rich or plain, wraps automatically)
         if fragment is not None:
-            cursor.insertFragment(fragment)
-        elif text is not None:
-            cursor.insertText(text)
-
-        self.transcript.setTextCursor(cursor)
+            body = _fragment_html(fragment)
+        else:
+            body = escape(text or "").replace("\n", "<br />")
+        sender_html = self._sender_html.get(sender) or escape(sender)
+        self.transcript.appendHtml(_MESSAGE_HTML % (sender_html, timestamp, body))
+        self.transcript.moveCursor(QTextCursor.End)
+
+    def _timestamp(self) -> str:
+        now = datetime.now()
+        key = (now.hour, now.minute)
+        if self._ts_cache is None or self._ts_cache[0] != key:
+            stamp = now.strftime("%H:%M") if self._ts_24h else now.strftime("%I:%M %p").lstrip("0")
+            self._ts_cache = (key, stamp)
+        return self._ts_cache[1]
 
     def _send_message(self) -> None:
         plain = self.input.toPlainText().strip()
         if not plain:
             return
-        # Capture rich HTML BEFORE clearing the editor
-        content_html = self.input.toHtml()
-        frag = QTextDocumentFragment(self.input.document())
-        self._append_to_transcript(self.local_screen_name, fragment=frag)
+        # Capture rich HTML BEFORE clearing the editor; unformatted text skips
+        # the HTML export and fragment copy and goes out as plain text only
+        doc = self.input.document()
+        if _has_rich_format(doc):
+            content_html = self.input.toHtml()
+            self._append_to_transcript(self.local_screen_name, fragment=QTextDocumentFragment(doc))
+        else:
+            content_html = ""
+            self._append_to_transcript(self.local_screen_name, text=plain)
         self.input.clear()
         # Reset typing format so next message isn't affected by previous styles (e.g., links)
         reset_fmt = QTextCharFormat()
@@ -221,18 +314,12 @@ class MessageWindow(QMainWindow):
         # Logging
         if self.settings.get("chat_transcripts_enabled", False):
             self._log_message(self.local_screen_name, plain)
-        # Send to peer via server
-        try:
-            base_url = self.settings.get("server_url", "http://127.0.0.1:5000")
-            sess = QApplication.instance().property("sb_session") or requests.Session()
-            # Send both plain and HTML for rich rendering on receiver
-            sess.post(
-                f"{base_url}/api/messages/send",
-                json={"to": self.peer_screen_name, "content": plain, "content_html": content_html},
-                timeout=4,
-            )
-        except Exception:
-            pass
+        # Send to peer via server; both plain and HTML for rich rendering on receiver
+        self._post_in_background(
+            "/api/messages/send",
+            {"to": self.peer_screen_name, "content": plain, "content_html": content_html},
+            timeout=4,
+        )
 
     def _restart_typing_throttle(self) -> None:
         # Restart the throttle timer so we ping at most every interval while typing
@@ -240,12 +327,20 @@ class MessageWindow(QMainWindow):
             self._typing_timer.start()
 
     def _send_typing_ping(self) -> None:
-        try:
-            base_url = self.settings.get("server_url", "http://127.0.0.1:5000")
-            sess = QApplication.instance().property("sb_session") or requests.Session()
-            sess.post(f"{base_url}/api/messages/typing", json={"to": self.peer_screen_name}, timeout=3)
-        except Exception:
-            pass
+        self._post_in_background("/api/messages/typing", {"to": self.peer_screen_name}, timeout=3)
+
+    def _post_in_background(self, path: str, payload: dict, timeout: float) -> None:
+        # Fire-and-forget on the send thread, so a slow server never freezes typing
+        base_url = self.settings.get("server_url", "http://127.0.0.1:5000")
+        sess = QApplication.instance().property("sb_session") or requests.Session()
+
+        def post() -> None:
+            try:
+                sess.post(f"{base_url}{path}", json=payload, timeout=timeout)
+            except Exception:
+                pass
+
+        _send_pool().start(post)
 
     def _warn_peer(self) -> None:
         self.statusBar().showMessage("Warned user (placeholder).", 2000)
@@ -261,6 +356,10 @@ class MessageWindow(QMainWindow):
             ):
                 self._send_message()
                 return True
+        # Esc backs out of the link editor without inserting anything
+        if obj is self._link_edit and event.type() == QEvent.KeyPress and event.key() == Qt.Key_Escape:
+            self._close_link_bar()
+            return True
         return super().eventFilter(obj, event)
 
     # --- Formatting helpers ---
@@ -297,10 +396,43 @@ class MessageWindow(QMainWindow):
         self._apply_char_format(fmt)
 
     def _insert_link(self) -> None:
-        url, ok = QInputDialog.getText(self, "Insert Link", "URL (https://...):")
-        if not ok or not url.strip():
+        # Non-modal: the URL is typed into a strip below the toolbar, so the
+        # event loop keeps running and the selection in the input is kept
+        if self._link_bar is None:
+            self._build_link_bar()
+        self._link_edit.clear()
+        self._link_bar.show()
+        self._link_edit.setFocus()
+
+    def _build_link_bar(self) -> None:
+        bar = QWidget(self)
+        row = QHBoxLayout(bar)
+        row.setContentsMargins(0, 0, 0, 0)
+        row.setSpacing(6)
+        self._link_edit = QLineEdit(bar)
+        self._link_edit.setPlaceholderText("URL (https://...)")
+        self._link_edit.returnPressed.connect(self._apply_link)
+        self._link_edit.installEventFilter(self)
+        insert_btn = QPushButton("Insert", bar)
+        insert_btn.clicked.connect(self._apply_link)
+        cancel_btn = QPushButton("Cancel", bar)
+        cancel_btn.clicked.connect(self._close_link_bar)
+        row.addWidget(self._link_edit, 1)
+        row.addWidget(insert_btn)
+        row.addWidget(cancel_btn)
+        layout = self.centralWidget().layout()
+        layout.insertWidget(layout.indexOf(self.fmt_toolbar) + 1, bar)
+        self._link_bar = bar
+
+    def _close_link_bar(self) -> None:
+        self._link_bar.hide()
+        self.input.setFocus()
+
+    def _apply_link(self) -> None:
+        url = self._link_edit.text().strip()
+        self._close_link_bar()
+        if not url:
             return
-        url = url.strip()
         cursor = self.input.textCursor()
         link_text = cursor.selectedText() or url
         fmt = QTextCharFormat()
@@ -320,31 +452,36 @@ class MessageWindow(QMainWindow):
         reset_fmt.setFontUnderline(False)
         self.input.mergeCurrentCharFormat(reset_fmt)
 
-    def _show_emoji_menu(self) -> None:
-        if not hasattr(self, "_emoji_menu"):
-            self._emoji_menu = QMenu(self)
-            emojis = ["😀", "😃", "😄", "😉", "😊", "😍", "😂", "👍", "🎉", "❤️", "🔥", "🙂", "😎"]
-            for e in emojis:
-                self._emoji_menu.addAction(e, lambda ch=False, x=e: self._insert_emoji(x))
-        pos = self.fmt_toolbar.mapToGlobal(self.fmt_toolbar.actionGeometry(self.act_emoji).bottomRight())
-        self._emoji_menu.popup(pos)
+    def _on_emoji_action(self, action: QAction) -> None:
+        # The glyph rides on the action's data, independent of how its label renders
+        emoji = action.data()
+        if emoji:
+            self._insert_emoji(emoji)
 
     def _insert_emoji(self, emoji: str) -> None:
         cursor = self.input.textCursor()
         cursor.insertText(emoji)
         self.input.setTextCursor(cursor)
 
+    def _schedule_toolbar_sync(self) -> None:
+        if not self._sync_pending:
+            self._sync_pending = True
+            QTimer.singleShot(0, self._sync_toolbar_from_cursor)
+
     def _sync_toolbar_from_cursor(self) -> None:
+        self._sync_pending = False
         fmt = self.input.currentCharFormat()
-        self.act_bold.blockSignals(True)
-        self.act_italic.blockSignals(True)
-        self.act_underline.blockSignals(True)
-        self.act_bold.setChecked(fmt.fontWeight() > QFont.Weight.Normal)
-        self.act_italic.setChecked(fmt.fontItalic())
-        self.act_underline.setChecked(fmt.fontUnderline())
-        self.act_bold.blockSignals(False)
-        self.act_italic.blockSignals(False)
-        self.act_underline.blockSignals(False)
+        # Compared against the actions themselves rather than a cached tuple,
+        # since clicking B/I/U also changes them; only differing ones are set
+        for act, on in (
+            (self.act_bold, fmt.fontWeight() > QFont.Weight.Normal),
+            (self.act_italic, fmt.fontItalic()),
+            (self.act_underline, fmt.fontUnderline()),
+        ):
+            if act.isChecked() != on:
+                act.blockSignals(True)
+                act.setChecked(on)
+                act.blockSignals(False)
 
     # --- Logging helpers ---
     def _log_message(self, sender: str, text: str) -> None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QObject, QThreadPool, Signal, Slot
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -17,14 +17,102 @@ from PySide6.QtWidgets import (
     QComboBox,
 )
 
-from ..storage import load_settings, save_settings, clear_all_saved_passwords, open_settings_folder, list_saved_accounts
+from ..storage import load_settings, save_settings, clear_all_saved_passwords, open_settings_folder
 from pathlib import Path
 from PySide6.QtWidgets import QFileDialog
-import json
+import orjson
 from ..resources import asset_path
 from .. import __version__
 
 
+# Settings shown in the dialog: (tab attribute, settings key, widget attribute,
+# widget kind, default). Drives loading, saving, import and reset alike.
+_FIELDS = (
+    ("tab_account", "last_screen_name", "default_name", "text", ""),
+    ("tab_account", "save_password", "chk_save_password", "check", False),
+    ("tab_account", "auto_login", "chk_auto_login", "check", False),
+    ("tab_connection", "server_url", "server_url", "text", "http://127.0.0.1:5000"),
+    ("tab_notifications", "notifications_sounds", "chk_notif_sounds", "check", True),
+    ("tab_notifications", "notifications_toasts", "chk_notif_toasts", "check", True),
+    ("tab_chat", "chat_default_bold", "chk_chat_bold", "check", False),
+    ("tab_chat", "chat_default_italic", "chk_chat_italic", "check", False),
+    ("tab_chat", "chat_allow_links", "chk_chat_links", "check", True),
+    ("tab_chat", "chat_emoji_replace", "chk_chat_emoji", "check", True),
+    ("tab_chat", "chat_transcripts_enabled", "chk_chat_logs", "check", False),
+    ("tab_appearance", "appearance_theme", "cmb_theme", "combo", "Light"),
+    ("tab_appearance", "appearance_timestamp_format", "cmb_ts", "combo", "12h"),
+    ("tab_appearance", "appearance_compact", "chk_compact", "check", False),
+    ("tab_privacy", "privacy_buddies_only", "chk_buddies_only", "check", False),
+    ("tab_privacy", "privacy_warn_confirm", "chk_warn_confirm", "check", True),
+)
+
+# Every rule for the dialog, parsed once when it's applied to the dialog;
+# widgets opt in through their object names
+_QSS = """
+    QLabel, QCheckBox { color: #000000; }
+    QTabBar::tab, QTabBar::tab:selected { color: #000000; }
+    QLabel#tabHeader { font-weight: 700; }
+    QLabel#hint { color: #666666; }
+    QLabel#brandTitle { font-size: 18px; font-weight: 800; color: #1e73be; }
+    QLabel#finePrint { color: #777777; font-size: 12px; }
+    QComboBox#choiceCombo { color: black; }
+    QComboBox#choiceCombo QAbstractItemView { color: white; background: #1f2937; }
+"""
+
+# Scaled brand icon for the About tab; rasterised from the SVG once per process,
+# on a pool thread so the first About tab doesn't wait on the SVG parse
+_BRAND_SIZE = 42
+_BRAND_PIXMAP: QPixmap | None = None
+_BRAND_LOADER: _BrandLoader | None = None
+# Callbacks waiting for the first render; drained by _BrandLoader.store
+_BRAND_PENDING: list = []
+
+
+class _BrandLoader(QObject):
+    ready = Signal(QImage)
+
+    @Slot(QImage)
+    def store(self, image: QImage) -> None:
+        # Runs on the GUI thread (this object's thread), where QPixmap is allowed
+        global _BRAND_PIXMAP
+        _BRAND_PIXMAP = QPixmap.fromImage(image)
+        pending = _BRAND_PENDING[:]
+        _BRAND_PENDING.clear()
+        for slot in pending:
+            try:
+                slot()
+            except RuntimeError:
+                # Its dialog was deleted before the render finished
+                pass
+
+
+def _render_brand() -> QImage:
+    # QImage (unlike QPixmap) is safe to build off the GUI thread; the SVG is
+    # rendered straight at icon size rather than rasterised large and scaled
+    reader = QImageReader(asset_path("sb_runner.svg"))
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(_BRAND_SIZE, _BRAND_SIZE, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def _request_brand(slot) -> None:
+    # slot runs once the pixmap exists: now if it's cached, else when the
+    # render finishes (a failed load is cached too, as a null pixmap)
+    # Everything here and in store runs on the GUI thread, so a slot is
+    # either queued before store drains the list or sees the cached pixmap.
+    global _BRAND_LOADER
+    if _BRAND_PIXMAP is not None:
+        slot()
+        return
+    _BRAND_PENDING.append(slot)
+    if _BRAND_LOADER is None:
+        # One render per process; the loader then stays as the set-once owner
+        _BRAND_LOADER = loader = _BrandLoader()
+        loader.ready.connect(loader.store)
+        QThreadPool.globalInstance().start(lambda: loader.ready.emit(_render_brand()))
+
+
 class SetupDialog(QDialog):
     """Preferences dialog with basic tabs. Starts with Account and Connection."""
 
@@ -32,57 +120,28 @@ class SetupDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("StrideBuddy Setup")
         self.setMinimumWidth(380)
-        # Ensure text is readable
-        self.setStyleSheet("QLabel { color: #000000; } QCheckBox { color: #000000; }")
+        self.setStyleSheet(_QSS)
 
         root = QVBoxLayout(self)
         self.tabs = QTabWidget(self)
-        # Ensure tab labels are visible on dark/light themes
-        self.tabs.setStyleSheet("QTabBar::tab { color: #000000; } QTabBar::tab:selected { color: #000000; }")
         root.addWidget(self.tabs)
 
         # Load current settings
         self.settings = load_settings()
 
-        # Account tab
-        self.tab_account = QWidget(self)
-        self._build_account_tab(self.tab_account)
-        self.tabs.addTab(self.tab_account, "Account")
-
-        # Connection tab
-        self.tab_connection = QWidget(self)
-        self._build_connection_tab(self.tab_connection)
-        self.tabs.addTab(self.tab_connection, "Connection")
-
-        # Notifications tab
-        self.tab_notifications = QWidget(self)
-        self._build_notifications_tab(self.tab_notifications)
-        self.tabs.addTab(self.tab_notifications, "Notifications")
-
-        # Chat tab
-        self.tab_chat = QWidget(self)
-        self._build_chat_tab(self.tab_chat)
-        self.tabs.addTab(self.tab_chat, "Chat")
-
-        # Appearance tab
-        self.tab_appearance = QWidget(self)
-        self._build_appearance_tab(self.tab_appearance)
-        self.tabs.addTab(self.tab_appearance, "Appearance")
-
-        # Privacy tab
-        self.tab_privacy = QWidget(self)
-        self._build_privacy_tab(self.tab_privacy)
-        self.tabs.addTab(self.tab_privacy, "Privacy")
-
-        # Data tab
-        self.tab_data = QWidget(self)
-        self._build_data_tab(self.tab_data)
-        self.tabs.addTab(self.tab_data, "Data")
-
-        # About tab
-        self.tab_about = QWidget(self)
-        self._build_about_tab(self.tab_about)
-        self.tabs.addTab(self.tab_about, "About")
+        # Tabs are empty pages until first shown; each builder runs once, and
+        # until then that tab's settings stay as loaded in self.settings
+        self._tab_builders: dict[QWidget, object] = {}
+        self.tab_account = self._add_lazy_tab("Account", self._build_account_tab)
+        self.tab_connection = self._add_lazy_tab("Connection", self._build_connection_tab)
+        self.tab_notifications = self._add_lazy_tab("Notifications", self._build_notifications_tab)
+        self.tab_chat = self._add_lazy_tab("Chat", self._build_chat_tab)
+        self.tab_appearance = self._add_lazy_tab("Appearance", self._build_appearance_tab)
+        self.tab_privacy = self._add_lazy_tab("Privacy", self._build_privacy_tab)
+        self.tab_data = self._add_lazy_tab("Data", self._build_data_tab)
+        self.tab_about = self._add_lazy_tab("About", self._build_about_tab)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tabs.currentIndex())
 
         # Dialog buttons
         self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, parent=self)
@@ -96,10 +155,49 @@ class SetupDialog(QDialog):
         buttons_row.addWidget(self.buttons)
         root.addLayout(buttons_row)
 
+    def _add_lazy_tab(self, name: str, builder) -> QWidget:
+        tab = QWidget(self)
+        self._tab_builders[tab] = builder
+        self.tabs.addTab(tab, name)
+        return tab
+
+    def _ensure_tab_built(self, index: int) -> None:
+        tab = self.tabs.widget(index)
+        builder = self._tab_builders.pop(tab, None)
+        if builder is not None:
+            # Usually runs while the dialog is showing; paint the filled tab once
+            self.setUpdatesEnabled(False)
+            try:
+                builder(tab)
+                self._apply_settings(self.settings, only=tab)
+            finally:
+                self.setUpdatesEnabled(True)
+
+    def _is_built(self, tab: QWidget) -> bool:
+        return tab not in self._tab_builders
+
+    def reload_from_settings(self) -> None:
+        """Re-read saved settings into the built tabs before reopening the dialog."""
+        self.settings = load_settings()
+        self._apply_settings(self.settings)
+        if self._is_built(self.tab_data):
+            self.btn_clear_pw.setText(self._clear_pw_label())
+        if self._is_built(self.tab_about):
+            self._about_links.setText(self._links_html())
+
+    def _clear_pw_label(self) -> str:
+        # Counted from the settings already loaded, only once the Data tab exists
+        saved = self.settings.get("saved_accounts") or []
+        return f"Clear saved passwords ({len(saved)} account(s))"
+
+    def _links_html(self) -> str:
+        base_url = self.settings.get("server_url", "http://127.0.0.1:5000")
+        return f'<a style="color:black;" href="{base_url}/help">Help Center</a>  •  <a style="color:black;" href="{base_url}/signup">Create an account</a>'
+
     def _build_account_tab(self, tab: QWidget) -> None:
         layout = QVBoxLayout(tab)
         header = QLabel("Account")
-        header.setStyleSheet("QLabel { font-weight: 700; }")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
@@ -107,22 +205,19 @@ class SetupDialog(QDialog):
         form.setFormAlignment(Qt.AlignTop)
 
         self.default_name = QLineEdit(tab)
-        self.default_name.setText(self.settings.get("last_screen_name", ""))
         form.addRow(QLabel("Default screen name:"), self.default_name)
         layout.addLayout(form)
 
         self.chk_save_password = QCheckBox("Save password", tab)
-        self.chk_save_password.setChecked(bool(self.settings.get("save_password", False)))
         layout.addWidget(self.chk_save_password)
 
         self.chk_auto_login = QCheckBox("Auto-login", tab)
-        self.chk_auto_login.setChecked(bool(self.settings.get("auto_login", False)))
         layout.addWidget(self.chk_auto_login)
 
     def _build_connection_tab(self, tab: QWidget) -> None:
         layout = QVBoxLayout(tab)
         header = QLabel("Connection")
-        header.setStyleSheet("QLabel { font-weight: 700; }")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
 
         form = QFormLayout()
@@ -131,92 +226,72 @@ class SetupDialog(QDialog):
 
         self.server_url = QLineEdit(tab)
         self.server_url.setPlaceholderText("http://127.0.0.1:5000")
-        self.server_url.setText(self.settings.get("server_url", "http://127.0.0.1:5000"))
         form.addRow(QLabel("Server URL:"), self.server_url)
         layout.addLayout(form)
 
     def _build_notifications_tab(self, tab: QWidget) -> None:
         layout = QVBoxLayout(tab)
         header = QLabel("Notifications")
-        header.setStyleSheet("QLabel { font-weight: 700; }")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
         self.chk_notif_sounds = QCheckBox("Enable sounds", tab)
-        self.chk_notif_sounds.setChecked(bool(self.settings.get("notifications_sounds", True)))
         layout.addWidget(self.chk_notif_sounds)
         self.chk_notif_toasts = QCheckBox("Desktop toasts", tab)
-        self.chk_notif_toasts.setChecked(bool(self.settings.get("notifications_toasts", True)))
         layout.addWidget(self.chk_notif_toasts)
         hint = QLabel("Per-buddy mute planned.")
-        hint.setStyleSheet("QLabel { color:#666666; }")
+        hint.setObjectName("hint")
         layout.addWidget(hint)
 
     def _build_chat_tab(self, tab: QWidget) -> None:
         layout = QVBoxLayout(tab)
         header = QLabel("Chat")
-        header.setStyleSheet("QLabel { font-weight: 700; }")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
         self.chk_chat_bold = QCheckBox("Default bold", tab)
-        self.chk_chat_bold.setChecked(bool(self.settings.get("chat_default_bold", False)))
         layout.addWidget(self.chk_chat_bold)
         self.chk_chat_italic = QCheckBox("Default italic", tab)
-        self.chk_chat_italic.setChecked(bool(self.settings.get("chat_default_italic", False)))
         layout.addWidget(self.chk_chat_italic)
         self.chk_chat_links = QCheckBox("Allow clickable links", tab)
-        self.chk_chat_links.setChecked(bool(self.settings.get("chat_allow_links", True)))
         layout.addWidget(self.chk_chat_links)
         self.chk_chat_emoji = QCheckBox("Replace emoji shortcodes", tab)
-        self.chk_chat_emoji.setChecked(bool(self.settings.get("chat_emoji_replace", True)))
         layout.addWidget(self.chk_chat_emoji)
         self.chk_chat_logs = QCheckBox("Enable transcript logging", tab)
-        self.chk_chat_logs.setChecked(bool(self.settings.get("chat_transcripts_enabled", False)))
         layout.addWidget(self.chk_chat_logs)
 
     def _build_appearance_tab(self, tab: QWidget) -> None:
         layout = QVBoxLayout(tab)
         header = QLabel("Appearance")
-        header.setStyleSheet("QLabel { font-weight: 700; }")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
         form = QFormLayout()
         form.setLabelAlignment(Qt.AlignRight)
         form.setFormAlignment(Qt.AlignTop)
         self.cmb_theme = QComboBox(tab)
         self.cmb_theme.addItems(["Light", "Retro", "Auto"])
-        self.cmb_theme.setCurrentText(self.settings.get("appearance_theme", "Light"))
-        # White text in dropdown list; black when selected
-        self.cmb_theme.setStyleSheet(
-            "QComboBox { color: black; }"
-            "QComboBox QAbstractItemView { color: white; background: #1f2937; }"
-        )
+        self.cmb_theme.setObjectName("choiceCombo")
         form.addRow(QLabel("Theme:"), self.cmb_theme)
         self.cmb_ts = QComboBox(tab)
         self.cmb_ts.addItems(["12h", "24h"])
-        self.cmb_ts.setCurrentText(self.settings.get("appearance_timestamp_format", "12h"))
-        self.cmb_ts.setStyleSheet(
-            "QComboBox { color: black; }"
-            "QComboBox QAbstractItemView { color: white; background: #1f2937; }"
-        )
+        self.cmb_ts.setObjectName("choiceCombo")
         form.addRow(QLabel("Timestamp:"), self.cmb_ts)
         layout.addLayout(form)
         self.chk_compact = QCheckBox("Compact spacing", tab)
-        self.chk_compact.setChecked(bool(self.settings.get("appearance_compact", False)))
         layout.addWidget(self.chk_compact)
 
     def _build_privacy_tab(self, tab: QWidget) -> None:
         layout = QVBoxLayout(tab)
         header = QLabel("Privacy")
-        header.setStyleSheet("QLabel { font-weight: 700; }")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
         self.chk_buddies_only = QCheckBox("Only allow messages from buddies", tab)
-        self.chk_buddies_only.setChecked(bool(self.settings.get("privacy_buddies_only", False)))
         layout.addWidget(self.chk_buddies_only)
         self.chk_warn_confirm = QCheckBox("Confirm before sending 'Warn'", tab)
-        self.chk_warn_confirm.setChecked(bool(self.settings.get("privacy_warn_confirm", True)))
         layout.addWidget(self.chk_warn_confirm)
 
     def _build_data_tab(self, tab: QWidget) -> None:
         layout = QVBoxLayout(tab)
         header = QLabel("Data")
-        header.setStyleSheet("QLabel { font-weight: 700; }")
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
         self.btn_open_folder = QPushButton("Open settings folder", tab)
         self.btn_open_folder.clicked.connect(open_settings_folder)
@@ -227,8 +302,8 @@ class SetupDialog(QDialog):
         self.btn_import = QPushButton("Import settings...", tab)
         self.btn_import.clicked.connect(self._import_settings)
         layout.addWidget(self.btn_import)
-        saved = list_saved_accounts()
-        self.btn_clear_pw = QPushButton(f"Clear saved passwords ({len(saved)} account(s))", tab)
+        # Only counted once the Data tab is opened, from the settings already loaded
+        self.btn_clear_pw = QPushButton(self._clear_pw_label(), tab)
         self.btn_clear_pw.clicked.connect(self._clear_saved_passwords)
         layout.addWidget(self.btn_clear_pw)
 
@@ -238,12 +313,11 @@ class SetupDialog(QDialog):
 
         # Brand header
         brand_row = QHBoxLayout()
-        icon_label = QLabel(tab)
-        pix = QPixmap(asset_path("sb_runner.svg"))
-        if not pix.isNull():
-            icon_label.setPixmap(pix.scaled(42, 42, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self._brand_label = icon_label = QLabel(tab)
+        icon_label.setFixedSize(_BRAND_SIZE, _BRAND_SIZE)
+        _request_brand(self._show_brand)
         title = QLabel("StrideBuddy")
-        title.setStyleSheet("QLabel { font-size: 18px; font-weight: 800; color: #1e73be; }")
+        title.setObjectName("brandTitle")
         brand_row.addWidget(icon_label)
         brand_row.addWidget(title)
         brand_row.addStretch(1)
@@ -253,60 +327,75 @@ class SetupDialog(QDialog):
         tagline = QLabel("A modern, nostalgic messenger inspired by the classics.")
         layout.addWidget(tagline)
         ver = QLabel(f"Version: {__version__}")
-        ver.setStyleSheet("QLabel { color: #666666; }")
+        ver.setObjectName("hint")
         layout.addWidget(ver)
 
         # Links
-        base_url = self.settings.get("server_url", "http://127.0.0.1:5000")
-        links = QLabel(f'<a style=\"color:black;\" href=\"{base_url}/help\">Help Center</a>  •  <a style=\"color:black;\" href=\"{base_url}/signup\">Create an account</a>')
-        links.setOpenExternalLinks(True)
-        layout.addWidget(links)
+        self._about_links = QLabel(self._links_html())
+        self._about_links.setOpenExternalLinks(True)
+        layout.addWidget(self._about_links)
 
         # Credits / legal
         fine = QLabel("© 2025 StrideBuddy. For personal and educational use.")
-        fine.setStyleSheet("QLabel { color: #777777; font-size: 12px; }")
+        fine.setObjectName("finePrint")
         layout.addStretch(1)
         layout.addWidget(fine)
 
+    @Slot()
+    def _show_brand(self) -> None:
+        if _BRAND_PIXMAP is not None and not _BRAND_PIXMAP.isNull():
+            self._brand_label.setPixmap(_BRAND_PIXMAP)
+
     def _on_accept(self) -> None:
-        # Persist modified settings
-        updated = dict(self.settings)
-        updated["last_screen_name"] = self.default_name.text().strip()
-        updated["save_password"] = bool(self.chk_save_password.isChecked())
-        updated["auto_login"] = bool(self.chk_auto_login.isChecked())
-        updated["server_url"] = self.server_url.text().strip() or "http://127.0.0.1:5000"
-        updated["notifications_sounds"] = bool(self.chk_notif_sounds.isChecked())
-        updated["notifications_toasts"] = bool(self.chk_notif_toasts.isChecked())
-        updated["chat_default_bold"] = bool(self.chk_chat_bold.isChecked())
-        updated["chat_default_italic"] = bool(self.chk_chat_italic.isChecked())
-        updated["chat_allow_links"] = bool(self.chk_chat_links.isChecked())
-        updated["chat_emoji_replace"] = bool(self.chk_chat_emoji.isChecked())
-        updated["chat_transcripts_enabled"] = bool(self.chk_chat_logs.isChecked())
-        updated["appearance_theme"] = self.cmb_theme.currentText()
-        updated["appearance_timestamp_format"] = self.cmb_ts.currentText()
-        updated["appearance_compact"] = bool(self.chk_compact.isChecked())
-        updated["privacy_buddies_only"] = bool(self.chk_buddies_only.isChecked())
-        updated["privacy_warn_confirm"] = bool(self.chk_warn_confirm.isChecked())
+        # Persist modified settings; tabs never opened keep their loaded values.
+        # load_settings hands out a private copy, so it's updated in place.
+        updated = self.settings
+        for tab_attr, key, attr, kind, default in _FIELDS:
+            if not self._is_built(getattr(self, tab_attr)):
+                continue
+            widget = getattr(self, attr)
+            if kind == "text":
+                updated[key] = widget.text().strip() or default
+            elif kind == "check":
+                updated[key] = widget.isChecked()
+            else:
+                updated[key] = widget.currentText()
         save_settings(updated)
         self.accept()
 
     def _reset_defaults(self) -> None:
-        self.default_name.setText("")
-        self.chk_save_password.setChecked(False)
-        self.chk_auto_login.setChecked(False)
-        self.server_url.setText("http://127.0.0.1:5000")
-        self.chk_notif_sounds.setChecked(True)
-        self.chk_notif_toasts.setChecked(True)
-        self.chk_chat_bold.setChecked(False)
-        self.chk_chat_italic.setChecked(False)
-        self.chk_chat_links.setChecked(True)
-        self.chk_chat_emoji.setChecked(True)
-        self.chk_chat_logs.setChecked(False)
-        self.cmb_theme.setCurrentText("Light")
-        self.cmb_ts.setCurrentText("12h")
-        self.chk_compact.setChecked(False)
-        self.chk_buddies_only.setChecked(False)
-        self.chk_warn_confirm.setChecked(True)
+        # Defaults are shown for every tab, so build any not yet opened
+        for index in range(self.tabs.count()):
+            self._ensure_tab_built(index)
+        self._apply_settings({key: default for _, key, _, _, default in _FIELDS})
+
+    def _apply_settings(self, src: dict, only: QWidget | None = None) -> None:
+        # Push values into the widgets of built tabs (or just `only`), one
+        # lookup per field, with change signals held until each is set
+        for tab_attr, key, attr, kind, default in _FIELDS:
+            tab = getattr(self, tab_attr)
+            if (only is not None and tab is not only) or not self._is_built(tab):
+                continue
+            widget = getattr(self, attr)
+            value = src.get(key, default)
+            # Widgets already showing the value are left alone: setting it again
+            # still costs a property-change and style pass
+            if kind == "text":
+                value, current = str(value or ""), widget.text()
+                setter = widget.setText
+            elif kind == "check":
+                value, current = bool(value), widget.isChecked()
+                setter = widget.setChecked
+            else:
+                value, current = str(value), widget.currentText()
+                setter = widget.setCurrentText
+            if value == current:
+                continue
+            widget.blockSignals(True)
+            try:
+                setter(value)
+            finally:
+                widget.blockSignals(False)
 
     # Data helpers
     def _export_settings(self) -> None:
@@ -314,39 +403,25 @@ class SetupDialog(QDialog):
         if not path:
             return
         data = load_settings()
-        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     def _import_settings(self) -> None:
         path, _ = QFileDialog.getOpenFileName(self, "Import settings", "", "JSON Files (*.json)")
         if not path:
             return
         try:
-            text = Path(path).read_text(encoding="utf-8")
-            data = json.loads(text)
+            data = orjson.loads(Path(path).read_bytes())
             save_settings(data)
-            # Rehydrate UI
+            # Rehydrate UI; unopened tabs read the new settings when built
             self.settings = load_settings()
-            self.default_name.setText(self.settings.get("last_screen_name", ""))
-            self.chk_save_password.setChecked(bool(self.settings.get("save_password")))
-            self.chk_auto_login.setChecked(bool(self.settings.get("auto_login")))
-            self.server_url.setText(self.settings.get("server_url", "http://127.0.0.1:5000"))
-            self.chk_notif_sounds.setChecked(bool(self.settings.get("notifications_sounds")))
-            self.chk_notif_toasts.setChecked(bool(self.settings.get("notifications_toasts")))
-            self.chk_chat_bold.setChecked(bool(self.settings.get("chat_default_bold")))
-            self.chk_chat_italic.setChecked(bool(self.settings.get("chat_default_italic")))
-            self.chk_chat_links.setChecked(bool(self.settings.get("chat_allow_links")))
-            self.chk_chat_emoji.setChecked(bool(self.settings.get("chat_emoji_replace")))
-            self.chk_chat_logs.setChecked(bool(self.settings.get("chat_transcripts_enabled")))
-            self.cmb_theme.setCurrentText(self.settings.get("appearance_theme", "Light"))
-            self.cmb_ts.setCurrentText(self.settings.get("appearance_timestamp_format", "12h"))
-            self.chk_compact.setChecked(bool(self.settings.get("appearance_compact")))
-            self.chk_buddies_only.setChecked(bool(self.settings.get("privacy_buddies_only")))
-            self.chk_warn_confirm.setChecked(bool(self.settings.get("privacy_warn_confirm", True)))
+            self._apply_settings(self.settings)
         except Exception:
             pass
 
     def _clear_saved_passwords(self) -> None:
         clear_all_saved_passwords()
+        # Keep OK from writing the cleared accounts back
+        self.settings["saved_accounts"] = []
         self.btn_clear_pw.setText("Clear saved passwords (0 account(s))")
 
 
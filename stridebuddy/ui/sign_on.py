@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize, Signal, QRect, QTimer
-from PySide6.QtGui import QPixmap, QIcon, QPainter, QColor
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import Qt, QSize, Signal, QRect, QTimer, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QPixmap, QIcon, QPainter, QColor, QPalette
 from PySide6.QtWidgets import (
     QWidget,
     QLabel,
@@ -22,10 +24,7 @@ from PySide6.QtWidgets import (
 
 from .. import __app_name__, __version__
 from ..resources import asset_path
-from .buddy_list import BuddyListWindow
 from .setup_dialog import SetupDialog
-import webbrowser
-import requests
 from ..storage import (
     load_settings,
     save_settings,
@@ -35,6 +34,103 @@ from ..storage import (
 )
 from ..style import apply_stridebuddy_style
 
+if TYPE_CHECKING:
+    import requests
+
+
+# (asset, width, height) -> scaled pixmap; each SVG is rasterised once per process
+_BANNER_PIXMAP_CACHE: dict[tuple[str, int, int], QPixmap] = {}
+_ICON_CACHE: dict[str, QIcon] = {}
+# Painted on first use, as a QPixmap needs the QApplication to exist
+_FALLBACK_CIRCLE: QPixmap | None = None
+
+
+def _fallback_circle() -> QPixmap:
+    global _FALLBACK_CIRCLE
+    if _FALLBACK_CIRCLE is None:
+        pix = QPixmap(QSize(72, 72))
+        pix.fill(Qt.transparent)
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setBrush(QColor("#ffd54f"))
+        p.setPen(Qt.NoPen)
+        p.drawEllipse(QRect(0, 0, 72, 72))
+        p.end()
+        _FALLBACK_CIRCLE = pix
+    return _FALLBACK_CIRCLE
+
+
+def _banner_pixmap(name: str, width: int, height: int) -> QPixmap:
+    key = (name, width, height)
+    pix = _BANNER_PIXMAP_CACHE.get(key)
+    if pix is None:
+        pix = QPixmap(asset_path(name))
+        # Fallback: a simple circle if SVG failed to load
+        if pix.isNull():
+            pix = _fallback_circle()
+        pix = _BANNER_PIXMAP_CACHE[key] = pix.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return pix
+
+
+def _asset_icon(name: str) -> QIcon:
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = QIcon(asset_path(name))
+    return icon
+
+
+def _new_login_session() -> requests.Session:
+    # requests is imported here rather than at module level so it stays
+    # off the path to the first paint of the sign-on form
+    import requests
+
+    sess = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    return sess
+
+
+class _PrewarmSignals(QObject):
+    ready = Signal(object)  # the warmed requests.Session
+
+
+class _LoginSignals(QObject):
+    finished = Signal(bool, dict, object, str)  # ok, reply body, session, network error
+
+
+class _LoginWorker(QRunnable):
+    """Posts the sign-on request from a pool thread and reports back via a queued signal."""
+
+    def __init__(self, sess: requests.Session, screen_name: str, password: str, login_url: str) -> None:
+        super().__init__()
+        # Owned by SignOnWindow._login_job until the result is handled
+        self.setAutoDelete(False)
+        self.screen_name = screen_name
+        self.password = password
+        self.login_url = login_url
+        self.sess = sess
+        self.signals = _LoginSignals()
+
+    def run(self) -> None:
+        try:
+            resp = self.sess.post(
+                self.login_url,
+                json={"screen_name": self.screen_name, "password": self.password},
+                timeout=5,
+            )
+        except Exception:
+            self.signals.finished.emit(False, {}, None, "Auth server not reachable. Start the server.")
+            return
+        try:
+            data = resp.json()
+        except ValueError:
+            # Not JSON (e.g. an HTML error page from a proxy)
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        self.signals.finished.emit(bool(resp.ok and data.get("ok")), data, self.sess, "")
+
 
 class LinkLabel(QLabel):
     """Clickable link-styled label."""
@@ -46,7 +142,6 @@ class LinkLabel(QLabel):
         self.setCursor(Qt.PointingHandCursor)
         self.setProperty("class", "link")
         self.setObjectName("link")
-        self.setStyleSheet("QLabel { color: #1e73be; }")
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         if event.button() == Qt.LeftButton:
@@ -60,49 +155,51 @@ class Banner(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setFixedHeight(110)
+        # Filled from the palette by Qt itself; no Python paintEvent per repaint
         self.setAutoFillBackground(True)
-        self._bg = QColor("#1e73be")
+        pal = self.palette()
+        pal.setColor(QPalette.Window, QColor("#1e73be"))
+        self.setPalette(pal)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 12)
         layout.setSpacing(12)
 
         logo = QLabel(self)
-        pix = QPixmap(asset_path("sb_runner.svg"))
-        # Fallback: draw a simple circle if SVG failed to load
-        if pix.isNull():
-            pix = QPixmap(QSize(72, 72))
-            pix.fill(Qt.transparent)
-            p = QPainter(pix)
-            p.setRenderHint(QPainter.Antialiasing)
-            p.setBrush(QColor("#ffd54f"))
-            p.setPen(Qt.NoPen)
-            p.drawEllipse(QRect(0, 0, 72, 72))
-            p.end()
-        logo.setPixmap(pix.scaled(90, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo.setPixmap(_banner_pixmap("sb_runner.svg", 90, 90))
 
         title = QLabel("StrideBuddy")
-        title.setStyleSheet(
-            "QLabel { color: white; font-family: Tahoma; font-size: 20px; font-weight: bold; }"
-        )
+        title.setObjectName("bannerTitle")
 
         layout.addWidget(logo, 0, Qt.AlignLeft | Qt.AlignVCenter)
         layout.addWidget(title, 1, Qt.AlignLeft | Qt.AlignVCenter)
 
-    def paintEvent(self, event) -> None:  # type: ignore[override]
-        p = QPainter(self)
-        p.fillRect(self.rect(), self._bg)
-        p.end()
-
 
 class SignOnWindow(QMainWindow):
     """Main sign-on window."""
 
     def __init__(self) -> None:
         super().__init__()
+        # Held until the form is assembled and filled from settings, so the
+        # first show does a single layout and paint
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(f"{__app_name__} - Sign On")
-        self.setWindowIcon(QIcon(asset_path("sb_runner.svg")))
+        self.setWindowIcon(_asset_icon("sb_runner.svg"))
         self.setFixedSize(320, 420)
+        # One window-level sheet for every child, parsed once; _set_error_state
+        # only flips the sbError property and re-polishes
+        self.setStyleSheet(
+            "QLabel#bannerTitle { color: white; font-family: Tahoma; font-size: 20px; font-weight: bold; }"
+            "QLabel#fieldLabel { color: #000000; padding-left: 6px; font-weight: 700; }"
+            "QLabel#link { color: #1e73be; }"
+            "QLabel#savedHint, QLabel#version { color: #666666; }"
+            "QLabel#errorLabel { color: #b91c1c; }"
+            "QCheckBox { color: #000000; }"
+            # Green-accented outline for Help and Setup
+            "QPushButton#footerButton { border: 1px solid #6ee7b7; border-radius: 4px; padding: 4px 10px; }"
+            "QPushButton#footerButton:hover { border-color: #10b981; }"
+            'QLineEdit[sbError="true"], QComboBox[sbError="true"] { border: 1px solid #e11d48; }'
+        )
 
         central = QWidget(self)
         self.setCentralWidget(central)
@@ -129,9 +226,7 @@ class SignOnWindow(QMainWindow):
 
         # Screen name row (labels placed above fields for visibility)
         screen_name_label = QLabel("ScreenName:")
-        screen_name_label.setStyleSheet(
-            "QLabel { color: #000000; padding-left: 6px; font-weight: 700; }"
-        )
+        screen_name_label.setObjectName("fieldLabel")
         self.screen_name = QComboBox()
         self.screen_name.setEditable(True)
         self.screen_name.setInsertPolicy(QComboBox.NoInsert)
@@ -149,9 +244,7 @@ class SignOnWindow(QMainWindow):
 
         # Password row
         password_label = QLabel("Password")
-        password_label.setStyleSheet(
-            "QLabel { color: #000000; padding-left: 6px; font-weight: 700; }"
-        )
+        password_label.setObjectName("fieldLabel")
         self.password = QLineEdit()
         self.password.setEchoMode(QLineEdit.Password)
         self.password.setFixedHeight(24)
@@ -161,7 +254,6 @@ class SignOnWindow(QMainWindow):
 
         self.saved_hint = LinkLabel("Saved - click here to change")
         self.saved_hint.setObjectName("savedHint")
-        self.saved_hint.setStyleSheet("QLabel#savedHint { color: #666666; }")
         self.saved_hint.setVisible(False)
         grid.addWidget(self.saved_hint, 8, 0, 1, 2, alignment=Qt.AlignLeft)
 
@@ -171,16 +263,13 @@ class SignOnWindow(QMainWindow):
         # Error feedback label (hidden by default)
         self.error_label = QLabel("")
         self.error_label.setObjectName("errorLabel")
-        self.error_label.setStyleSheet("QLabel#errorLabel { color: #b91c1c; }")
         self.error_label.setVisible(False)
         grid.addWidget(self.error_label, 10, 0, 1, 2, alignment=Qt.AlignLeft)
 
         # Options
         options_row = QHBoxLayout()
         self.save_password = QCheckBox("Save password")
-        self.save_password.setStyleSheet("QCheckBox { color: #000000; }")
         self.auto_login = QCheckBox("Auto-login")
-        self.auto_login.setStyleSheet("QCheckBox { color: #000000; }")
         options_row.setSpacing(12)
         options_row.addWidget(self.save_password)
         options_row.addStretch(1)
@@ -196,16 +285,8 @@ class SignOnWindow(QMainWindow):
         self.setup_btn = QPushButton("&Setup")
         self.signon_btn = QPushButton("&Sign On")
         self.signon_btn.setDefault(True)
-        # Add green border to Help (to match Sign On outline)
-        self.help_btn.setStyleSheet(
-            "QPushButton { border: 1px solid #6ee7b7; border-radius: 4px; padding: 4px 10px; }"
-            "QPushButton:hover { border-color: #10b981; }"
-        )
-        # Add green border to Setup as well
-        self.setup_btn.setStyleSheet(
-            "QPushButton { border: 1px solid #6ee7b7; border-radius: 4px; padding: 4px 10px; }"
-            "QPushButton:hover { border-color: #10b981; }"
-        )
+        self.help_btn.setObjectName("footerButton")
+        self.setup_btn.setObjectName("footerButton")
         button_row.addWidget(self.help_btn)
         button_row.addWidget(self.setup_btn)
         button_row.addStretch(1)
@@ -216,7 +297,7 @@ class SignOnWindow(QMainWindow):
         root.addStretch(1)  # Push version to the very bottom
         version = QLabel(f"Version: {__version__}")
         version.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        version.setStyleSheet("QLabel { color: #666666; }")
+        version.setObjectName("version")
         root.addWidget(version)
 
         # Wire up behaviors
@@ -229,70 +310,158 @@ class SignOnWindow(QMainWindow):
         # Clear errors when user edits fields
         self.password.textChanged.connect(lambda: self._clear_error())
         self.screen_name.editTextChanged.connect(self._on_screen_name_changed)
+        # Keyring lookups wait for a pause in typing rather than every keystroke
+        self._name_debounce = QTimer(self)
+        self._name_debounce.setSingleShot(True)
+        self._name_debounce.setInterval(250)
+        self._name_debounce.timeout.connect(self._do_name_lookup)
+        # Name whose saved password the form currently reflects; None forces a fresh lookup
+        self._last_name_queried: str | None = None
+        # Leaving the name box runs a pending lookup now, before the user types
+        # a password; a password typed since the last lookup is never replaced
+        self._pw_edited = False
+        self.screen_name.lineEdit().editingFinished.connect(self._flush_name_lookup)
+        self.password.textEdited.connect(self._on_password_edited)
+
+        # Built on first Setup click and kept for later opens
+        self._setup_dlg: SetupDialog | None = None
+        # Login in flight on the pool; also keeps the runnable alive
+        self._login_job: _LoginWorker | None = None
+        # One keep-alive session for every attempt, so a retry after a failed
+        # login reuses the pooled connection; made on first use (_login_session)
+        self._sess = QApplication.instance().property("sb_session")
+        self._prewarm_signals: _PrewarmSignals | None = None
+        # Refreshed only when we save or Setup is accepted
+        self._settings_cache = load_settings()
+        # Server URLs for the links and login, rebuilt only when server_url can change
+        self._endpoints: dict[str, str] = {}
+        self._rebuild_endpoints()
 
         # Load settings and maybe auto-login
         self._load_settings_and_maybe_autologin()
+        self.setUpdatesEnabled(True)
+        QTimer.singleShot(0, self._prewarm)
 
     # --- Behaviors (stubbed for now) ---
     def _sign_on(self) -> None:
         # Real login via local server
         screen_name = self.screen_name.currentText().strip()
         password = self.password.text()
+        if self._login_job is not None:
+            return
+        # The typed password wins over a lookup still waiting to fire
+        self._name_debounce.stop()
         if not screen_name or not password:
             self._show_error("Enter screen name and password.")
             return
         self._clear_error()
         self.signon_btn.setEnabled(False)
         self.statusBar().showMessage("Signing on...", 1500)
-        try:
-            base_url = load_settings().get("server_url", "http://127.0.0.1:5000")
-            # Use a persistent session so cookies (login) persist across API calls
-            sess = requests.Session()
-            resp = sess.post(
-                f"{base_url}/api/auth/login",
-                json={"screen_name": screen_name, "password": password},
-                timeout=5,
-            )
-            data = resp.json() if resp.headers.get("content-type","").startswith("application/json") else {}
-            if resp.ok and data.get("ok"):
-                self.statusBar().showMessage("Signed on.", 1000)
-                # Persist preferences without clobbering other settings
-                st = load_settings()
-                st.update({
-                    "last_screen_name": screen_name,
-                    "save_password": self.save_password.isChecked(),
-                    "auto_login": self.auto_login.isChecked(),
-                })
-                save_settings(st)
-                if self.save_password.isChecked():
-                    set_saved_password(screen_name, password)
-                    self.saved_hint.setVisible(True)
-                else:
-                    delete_saved_password(screen_name)
-                    self.saved_hint.setVisible(False)
-                # Store session globally on the app so workers and windows can reuse it
-                QApplication.instance().setProperty("sb_session", sess)
-                self._open_buddy_list()
-            else:
-                self._show_error(data.get("error") or "Invalid screen name or password.")
-        except Exception as e:
-            self._show_error("Auth server not reachable. Start the server.")
-        finally:
-            self.signon_btn.setEnabled(True)
+        # Posted from a pool thread; the answer arrives via _on_login_result
+        job = _LoginWorker(self._login_session(), screen_name, password, self._endpoints["login"])
+        job.signals.finished.connect(self._on_login_result)
+        self._login_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _on_login_result(self, ok: bool, data: dict, sess: object, err: str) -> None:
+        job, self._login_job = self._login_job, None
+        self.signon_btn.setEnabled(True)
+        if job is None:
+            return
+        if err:
+            self._show_error(err)
+            return
+        if not ok:
+            self._show_error(data.get("error") or "Invalid screen name or password.")
+            return
+        screen_name = job.screen_name
+        self.statusBar().showMessage("Signed on.", 1000)
+        # Persist preferences without clobbering other settings; the usual
+        # same-user re-sign-on changes nothing and skips the write. Start from
+        # the file (mtime-cached), not _settings_cache: the keyring helpers
+        # write saved_accounts behind this window's back
+        st = load_settings()
+        new_vals = {
+            "last_screen_name": screen_name,
+            "save_password": self.save_password.isChecked(),
+            "auto_login": self.auto_login.isChecked(),
+        }
+        if any(st.get(k) != v for k, v in new_vals.items()):
+            st.update(new_vals)
+            save_settings(st)
+        # The keyring entry changes below; the next name edit must query it again
+        self._last_name_queried = None
+        if self.save_password.isChecked():
+            set_saved_password(screen_name, job.password)
+            self.saved_hint.setVisible(True)
+        else:
+            delete_saved_password(screen_name)
+            self.saved_hint.setVisible(False)
+        self._settings_cache = load_settings()
+        # Store session globally on the app so workers and windows can reuse it
+        QApplication.instance().setProperty("sb_session", sess)
+        self._open_buddy_list()
+
+    def _login_session(self) -> requests.Session:
+        # Normally handed over by the prewarm probe; made here only if Sign On
+        # beats it
+        if self._sess is None:
+            self._sess = _new_login_session()
+        return self._sess
+
+    def _prewarm(self) -> None:
+        # Opens the pooled connection while the user is still typing, so the
+        # first Sign On skips the TCP handshake; failures are left to Sign On.
+        # The requests import and session setup happen on the pool thread too,
+        # keeping them off the GUI thread ahead of the first paint.
+        existing = self._sess
+        url = self._endpoints["health"]
+        signals = self._prewarm_signals = _PrewarmSignals()
+        signals.ready.connect(self._adopt_session)
+
+        def probe() -> None:
+            sess = existing or _new_login_session()
+            try:
+                sess.get(url, timeout=2)
+            except Exception:
+                pass
+            signals.ready.emit(sess)
+
+        QThreadPool.globalInstance().start(probe)
+
+    def _adopt_session(self, sess: object) -> None:
+        self._prewarm_signals = None
+        # A Sign On that ran first keeps the session it already made
+        if self._sess is None:
+            self._sess = sess
+
+    def _rebuild_endpoints(self) -> None:
+        base = self._settings_cache.get("server_url", "http://127.0.0.1:5000")
+        self._endpoints = {
+            "signup": base + "/signup",
+            "forgot": base + "/forgot",
+            "help": base + "/help",
+            "login": base + "/api/auth/login",
+            "health": base + "/api/health",
+        }
 
     def _get_screen_name(self) -> None:
-        base_url = load_settings().get("server_url", "http://127.0.0.1:5000")
-        webbrowser.open(f"{base_url}/signup")
+        import webbrowser
+        webbrowser.open(self._endpoints["signup"])
 
     def _forgot_password(self) -> None:
-        base_url = load_settings().get("server_url", "http://127.0.0.1:5000")
-        webbrowser.open(f"{base_url}/forgot")
+        import webbrowser
+        webbrowser.open(self._endpoints["forgot"])
 
     def _open_help(self) -> None:
-        base_url = load_settings().get("server_url", "http://127.0.0.1:5000")
-        webbrowser.open(f"{base_url}/help")
+        import webbrowser
+        webbrowser.open(self._endpoints["help"])
 
     def _open_buddy_list(self) -> None:
+        # Imported on first sign-on: the buddy list (and message windows and
+        # requests behind it) isn't needed to show the sign-on form
+        from .buddy_list import BuddyListWindow
+
         # Determine local screen name to pass to child windows
         local_name = self.screen_name.currentText().strip() or "You"
         self._buddy = BuddyListWindow(local_name, on_signoff=self._on_signed_off)
@@ -310,30 +479,37 @@ class SignOnWindow(QMainWindow):
     def _show_error(self, message: str) -> None:
         self.error_label.setText(message)
         self.error_label.setVisible(True)
-        # Highlight fields
-        self.password.setStyleSheet("QLineEdit { border: 1px solid #e11d48; }")
-        self.screen_name.setStyleSheet("QComboBox { border: 1px solid #e11d48; }")
+        self._set_error_state(True)
         self.statusBar().showMessage(message, 4000)
 
     def _clear_error(self) -> None:
         if self.error_label.isVisible():
             self.error_label.setVisible(False)
-        # Reset field styles
-        self.password.setStyleSheet("")
-        self.screen_name.setStyleSheet("")
+        self._set_error_state(False)
+
+    def _set_error_state(self, on: bool) -> None:
+        # Runs on every keystroke via _clear_error, so re-polish only on a real change
+        for field in (self.password, self.screen_name):
+            if bool(field.property("sbError")) == on:
+                continue
+            field.setProperty("sbError", on)
+            field.style().unpolish(field)
+            field.style().polish(field)
 
     # --- Settings & saved password helpers ---
     def _load_settings_and_maybe_autologin(self) -> None:
-        st = load_settings()
+        st = self._settings_cache
         last = st.get("last_screen_name") or ""
         save_pw = bool(st.get("save_password"))
         auto = bool(st.get("auto_login"))
         if last:
-            self.screen_name.setEditText(last)
+            self._set_screen_name_text(last)
         self.save_password.setChecked(save_pw)
         self.auto_login.setChecked(auto)
 
         pwd = get_saved_password(last) if save_pw and last else None
+        if save_pw and last:
+            self._last_name_queried = last
         if pwd:
             self.password.setText(pwd)
             self.saved_hint.setVisible(True)
@@ -345,7 +521,26 @@ class SignOnWindow(QMainWindow):
 
     def _on_screen_name_changed(self, *_args) -> None:
         self._clear_error()
+        self._name_debounce.start()
+
+    def _flush_name_lookup(self) -> None:
+        if self._name_debounce.isActive():
+            self._name_debounce.stop()
+            self._do_name_lookup()
+
+    def _on_password_edited(self, _text: str) -> None:
+        self._pw_edited = True
+
+    def _do_name_lookup(self) -> None:
         name = self.screen_name.currentText().strip()
+        if name == self._last_name_queried:
+            return
+        self._last_name_queried = name
+        edited, self._pw_edited = self._pw_edited, False
+        if edited:
+            # Keep what the user typed; the saved hint no longer describes it
+            self.saved_hint.setVisible(False)
+            return
         pwd = get_saved_password(name)
         if pwd:
             self.password.setText(pwd)
@@ -354,24 +549,40 @@ class SignOnWindow(QMainWindow):
             self.password.clear()
             self.saved_hint.setVisible(False)
 
+    def _set_screen_name_text(self, text: str) -> None:
+        # Programmatic fills shouldn't schedule a keyring lookup; callers do their own
+        self.screen_name.blockSignals(True)
+        try:
+            self.screen_name.setEditText(text)
+        finally:
+            self.screen_name.blockSignals(False)
+
     def _clear_saved_password(self) -> None:
         name = self.screen_name.currentText().strip()
         delete_saved_password(name)
+        self._settings_cache = load_settings()
+        self._last_name_queried = name
         self.password.clear()
         self.saved_hint.setVisible(False)
         self.statusBar().showMessage("Saved password cleared.", 2000)
 
     # --- Setup dialog ---
     def _open_setup(self) -> None:
-        dlg = SetupDialog(self)
-        if dlg.exec() == QDialog.Accepted:
-            st = load_settings()
+        if self._setup_dlg is None:
+            self._setup_dlg = SetupDialog(self)
+        else:
+            # Drop edits left over from a cancelled open
+            self._setup_dlg.reload_from_settings()
+        if self._setup_dlg.exec() == QDialog.Accepted:
+            st = self._settings_cache = load_settings()
+            self._rebuild_endpoints()
             # Re-apply style globally based on new settings
             apply_stridebuddy_style(QApplication.instance(), st)
-            self.screen_name.setEditText(st.get("last_screen_name", ""))
+            self._set_screen_name_text(st.get("last_screen_name", ""))
             self.save_password.setChecked(bool(st.get("save_password")))
             self.auto_login.setChecked(bool(st.get("auto_login")))
-            pwd = get_saved_password(self.screen_name.currentText().strip())
-            self.saved_hint.setVisible(bool(pwd))
+            # Setup may have cleared saved passwords, so look the name up afresh
+            self._last_name_queried = None
+            self._do_name_lookup()
 
 